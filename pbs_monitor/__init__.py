@@ -6,8 +6,22 @@ __version__ = "0.1.0"
 __author__ = "PBS Monitor Team"
 __description__ = "Tools for users of systems with the PBS scheduler"
 
-from .pbs_commands import PBSCommands
-from .data_collector import DataCollector
-from .config import Config
+__all__ = ['PBSCommands', 'DataCollector', 'Config']
 
-__all__ = ['PBSCommands', 'DataCollector', 'Config'] 
\ No newline at end of file
+# Public classes are imported on first access so that 'import pbs_monitor'
+# (and the CLI help path) doesn't load the database/ORM stack
+_LAZY_IMPORTS = {
+   'PBSCommands': '.pbs_commands',
+   'DataCollector': '.data_collector',
+   'Config': '.config',
+}
+
+
+def __getattr__(name: str):
+   """Import public classes lazily"""
+   if name in _LAZY_IMPORTS:
+      import importlib
+      value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+      globals()[name] = value
+      return value
+   raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""
+Entry point for running PBS Monitor as a module (python -m pbs_monitor)
+
+Only the lightweight CLI module is imported here; command implementations,
+configuration and the database layer load on demand inside main().
+"""
+
+import sys
+
+from .cli.main import main
+
+
+if __name__ == "__main__":
+   sys.exit(main())
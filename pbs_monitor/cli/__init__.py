@@ -3,6 +3,13 @@ Command line interface for PBS Monitor
 """
 
 from .main import main
-from .commands import StatusCommand, JobsCommand, NodesCommand, QueuesCommand, HistoryCommand
 
-__all__ = ['main', 'StatusCommand', 'JobsCommand', 'NodesCommand', 'QueuesCommand', 'HistoryCommand'] 
\ No newline at end of file
+__all__ = ['main', 'StatusCommand', 'JobsCommand', 'NodesCommand', 'QueuesCommand', 'HistoryCommand']
+
+
+def __getattr__(name: str):
+   """Import command classes on first access so that importing the CLI stays cheap"""
+   if name in __all__:
+      from . import commands
+      return getattr(commands, name)
+   raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,294 @@
+"""
+Argument parser for the analyze command
+
+Kept separate from main.py so the analysis sub-commands are only built
+when the analyze command is actually used.
+"""
+
+import argparse
+
+
+def build(analyze_parser: argparse.ArgumentParser) -> None:
+   """
+   Add the analysis actions to the analyze command parser
+   
+   Args:
+      analyze_parser: Parser for the analyze command
+   """
+   
+   analyze_subparsers = analyze_parser.add_subparsers(
+      dest="analyze_action",
+      help="Analysis actions"
+   )
+   
+   # Analyze run-now
+   run_now_parser = analyze_subparsers.add_parser(
+      "run-now",
+      help="Suggest a job shape you can run right now safely"
+   )
+   run_now_parser.add_argument(
+      "-b", "--buffer-minutes",
+      type=int,
+      default=8,
+      help="Safety buffer before contention in minutes (default: 8)"
+   )
+   run_now_parser.add_argument(
+      "--format",
+      choices=["table", "json"],
+      default="table",
+      help="Output format (default: table)"
+   )
+   run_now_parser.add_argument(
+      "-r", "--refresh",
+      action="store_true",
+      help="Force refresh of data"
+   )
+   
+   # Analyze run-score
+   run_score_parser = analyze_subparsers.add_parser(
+      "run-score",
+      help="Analyze job scores at queue → run transitions"
+   )
+   run_score_parser.add_argument(
+      "-d", "--days",
+      type=int,
+      default=30,
+      help="Number of days to analyze (default: 30)"
+   )
+   run_score_parser.add_argument(
+      "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Output format (default: table)"
+   )
+   
+   # Analyze walltime-efficiency-by-user
+   walltime_user_parser = analyze_subparsers.add_parser(
+      "walltime-efficiency-by-user",
+      help="Analyze walltime efficiency by user"
+   )
+   walltime_user_parser.add_argument(
+      "-d", "--days",
+      type=int,
+      default=30,
+      help="Number of days to analyze (default: 30)"
+   )
+   walltime_user_parser.add_argument(
+      "-u", "--user",
+      help="Filter to specific user (partial match, case-sensitive)"
+   )
+   walltime_user_parser.add_argument(
+      "--min-jobs",
+      type=int,
+      default=3,
+      help="Minimum number of jobs required for main table inclusion (default: 3)"
+   )
+   walltime_user_parser.add_argument(
+      "-q", "--queue",
+      help="Filter by queue name (partial match, case-sensitive)"
+   )
+   walltime_user_parser.add_argument(
+      "--min-nodes",
+      type=int,
+      help="Minimum number of nodes required for job inclusion"
+   )
+   walltime_user_parser.add_argument(
+      "--max-nodes",
+      type=int,
+      help="Maximum number of nodes allowed for job inclusion"
+   )
+   walltime_user_parser.add_argument(
+      "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Output format (default: table)"
+   )
+   
+   # Analyze walltime-efficiency-by-project
+   walltime_project_parser = analyze_subparsers.add_parser(
+      "walltime-efficiency-by-project",
+      help="Analyze walltime efficiency by project"
+   )
+   walltime_project_parser.add_argument(
+      "-d", "--days",
+      type=int,
+      default=30,
+      help="Number of days to analyze (default: 30)"
+   )
+   walltime_project_parser.add_argument(
+      "-p", "--project",
+      help="Filter to specific project (partial match, case-sensitive)"
+   )
+   walltime_project_parser.add_argument(
+      "--min-jobs",
+      type=int,
+      default=3,
+      help="Minimum number of jobs required for main table inclusion (default: 3)"
+   )
+   walltime_project_parser.add_argument(
+      "-q", "--queue",
+      help="Filter by queue name (partial match, case-sensitive)"
+   )
+   walltime_project_parser.add_argument(
+      "--min-nodes",
+      type=int,
+      help="Minimum number of nodes required for job inclusion"
+   )
+   walltime_project_parser.add_argument(
+      "--max-nodes",
+      type=int,
+      help="Maximum number of nodes allowed for job inclusion"
+   )
+   walltime_project_parser.add_argument(
+      "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Output format (default: table)"
+   )
+   
+   # Analyze reservation-utilization
+   reservation_util_parser = analyze_subparsers.add_parser(
+      "reservation-utilization",
+      help="Analyze reservation utilization efficiency"
+   )
+   reservation_util_parser.add_argument(
+      "reservation_ids",
+      nargs="*",
+      help="Specific reservation IDs to analyze (if not provided, analyzes all)"
+   )
+   reservation_util_parser.add_argument(
+      "--start-date",
+      type=str,
+      help="Start date for analysis period (YYYY-MM-DD format)"
+   )
+   reservation_util_parser.add_argument(
+      "--end-date",
+      type=str,
+      help="End date for analysis period (YYYY-MM-DD format)"
+   )
+   reservation_util_parser.add_argument(
+      "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Output format (default: table)"
+   )
+   
+   # Analyze reservation-trends
+   reservation_trends_parser = analyze_subparsers.add_parser(
+      "reservation-trends",
+      help="Analyze reservation utilization trends over time"
+   )
+   reservation_trends_parser.add_argument(
+      "-d", "--days",
+      type=int,
+      default=30,
+      help="Number of days to analyze (default: 30)"
+   )
+   reservation_trends_parser.add_argument(
+      "-o", "--owner",
+      help="Filter by reservation owner"
+   )
+   reservation_trends_parser.add_argument(
+      "-q", "--queue",
+      help="Filter by queue name"
+   )
+   reservation_trends_parser.add_argument(
+      "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Output format (default: table)"
+   )
+   
+   # Analyze reservation-owner-ranking
+   reservation_ranking_parser = analyze_subparsers.add_parser(
+      "reservation-owner-ranking",
+      help="Rank reservation owners by utilization efficiency"
+   )
+   reservation_ranking_parser.add_argument(
+      "-d", "--days",
+      type=int,
+      default=30,
+      help="Number of days to analyze (default: 30)"
+   )
+   reservation_ranking_parser.add_argument(
+      "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Output format (default: table)"
+   )
+
+   # Analyze usage-insights (Milestone 1)
+   usage_insights_parser = analyze_subparsers.add_parser(
+      "usage-insights",
+      help="Usage insights derived metrics and initial plots"
+   )
+   usage_insights_parser.add_argument(
+      "-d", "--days",
+      type=int,
+      default=30,
+      help="Number of days to analyze (default: 30)"
+   )
+   usage_insights_parser.add_argument(
+       "-m", "--min-queue-node-hours",
+      type=float,
+      default=100.0,
+      help="Minimum requested node-hours per queue to include (default: 100)"
+   )
+   usage_insights_parser.add_argument(
+       "-n", "--top-n-queues",
+      type=int,
+      help="Limit to top-N queues by requested node-hours"
+   )
+   usage_insights_parser.add_argument(
+       "-R", "--incl-resv",
+       action="store_true",
+       help="Include reservation queues (names like M12345/R12345/S12345) in analysis"
+    )
+   usage_insights_parser.add_argument(
+       "-a", "--allowlist-queues",
+      nargs='+',
+      help="Queues to always include regardless of thresholds"
+   )
+   usage_insights_parser.add_argument(
+       "-x", "--ignore-queues",
+      nargs='+',
+      help="Queues to exclude from analysis and plots"
+   )
+   usage_insights_parser.add_argument(
+       "-o", "--output-dir",
+      help="Directory to save plots"
+   )
+   usage_insights_parser.add_argument(
+       "-P", "--no-plots",
+      action="store_true",
+      help="Do not generate plots; only compute metrics"
+   )
+   usage_insights_parser.add_argument(
+       "-f", "--format",
+      choices=["table", "csv"],
+      default="table",
+      help="Metrics output format (default: table)"
+   )
+   usage_insights_parser.add_argument(
+       "-t", "--ts-freq",
+      choices=["H", "D", "W"],
+      default="D",
+      help="Time-series frequency for advanced plots: H (hourly), D (daily), W (weekly)"
+   )
+   usage_insights_parser.add_argument(
+       "-U", "--per-user-top-n",
+      type=int,
+      default=20,
+      help="Top N users by job count to include in per-user plots (advanced suite)"
+   )
+   usage_insights_parser.add_argument(
+       "-j", "--per-user-min-jobs",
+      type=int,
+      default=3,
+      help="Minimum jobs per user to be included in per-user plots (advanced suite)"
+   )
+   usage_insights_parser.add_argument(
+      "--total-cluster-nodes",
+      type=int,
+      help=argparse.SUPPRESS
+   )
@@ -3,26 +3,25 @@ Command implementations for PBS Monitor CLI
 """
 
 import argparse
+import functools
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import operator
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable, TYPE_CHECKING
 from datetime import datetime
 from abc import ABC, abstractmethod
 
 from tabulate import tabulate
 from rich.console import Console
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
-from ..data_collector import DataCollector
 from ..config import Config
 from ..models.job import PBSJob, JobState
 from ..models.queue import PBSQueue
 from ..models.node import PBSNode, NodeState
 from ..models.reservation import PBSReservation, ReservationState
-from ..database.migrations import (
-    initialize_database, migrate_database, validate_database,
-    backup_database, restore_database, clean_old_data, get_database_info
-)
 from ..utils.formatters import (
    format_duration, format_timestamp, format_memory,
    format_percentage, format_number, format_job_id, format_state
@@ -37,13 +36,110 @@ import json
 import getpass
 from pathlib import Path
 
-import pandas as pd
+# Only needed for annotations; the modules are imported where they are used
+if TYPE_CHECKING:
+   import pandas as pd
+   from ..data_collector import DataCollector
+
+
+# Parsed once and shared by every table instead of re-parsing style strings per column
+_HEADER_STYLE = Style(bold=True, color="magenta")
+_COLUMN_STYLE = Style(color="cyan")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_console(width: Optional[int], use_colors: bool) -> Console:
+   """
+   Get a shared Rich console for the given display settings
+   
+   Reusing the console across command instances keeps Rich's style and
+   measurement caches warm for repeated invocations in the same process.
+   Terminal detection is left to Rich when colors are enabled so that
+   piped output is not filled with escape codes.
+   
+   Args:
+      width: Console width (None lets Rich auto-detect)
+      use_colors: Whether colored output is enabled
+      
+   Returns:
+      Console instance
+   """
+   return Console(
+      width=width,
+      force_terminal=None if use_colors else False
+   )
+
+
+# Enum-to-string lookups built once at import; avoids the Enum.value
+# descriptor call on every state reference in filters, sort keys and formatters
+_JOB_STATE_STR = {s: s.value for s in JobState}
+_NODE_STATE_STR = {s: s.value for s in NodeState}
+_NODE_STATE_KEY = {s: s.value.replace('-', '_') for s in NodeState}
+_PENDING_JOB_STATES = frozenset((JobState.QUEUED, JobState.HELD, JobState.WAITING))
+_FINISHED_JOB_STATES = frozenset((JobState.COMPLETED, JobState.FINISHED, JobState.EXITING))
+
+
+def _iter_rows(items: Iterable[Any], formatters: List[Callable[[Any], str]]) -> Iterator[List[str]]:
+   """Yield one formatted table row per item"""
+   for item in items:
+      yield [fmt(item) for fmt in formatters]
+
+
+def _current_queue_seconds(job: PBSJob) -> int:
+   """Calculate current queue time in seconds for sorting"""
+   
+   if not job.submit_time:
+      return -1
+   
+   # For completed/running jobs, use queue_time_seconds if available
+   if job.queue_time_seconds is not None:
+      return job.queue_time_seconds
+   
+   # For jobs still in queue, calculate against current time
+   if job.state in _PENDING_JOB_STATES:  # Queued, Held, or Waiting states
+      now = datetime.now(job.submit_time.tzinfo)  # Use same timezone as submit_time
+      queue_duration = now - job.submit_time
+      return int(queue_duration.total_seconds())
+   
+   return -1
+
+
+# Sort key functions for the jobs table, built once per process. Plain
+# attribute keys use operator.attrgetter, which runs entirely in C.
+_JOB_SORT_KEYS = {
+   'job_id': operator.attrgetter('job_id'),
+   'name': lambda j: j.job_name.lower(),
+   'owner': lambda j: j.owner.lower(),
+   'project': lambda j: (j.project or '').lower(),
+   'allocation': lambda j: (j.allocation_type or '').lower(),
+   'state': operator.attrgetter('state.value'),
+   'queue': lambda j: j.queue.lower(),
+   'nodes': operator.attrgetter('nodes'),
+   'ppn': operator.attrgetter('ppn'),
+   'walltime': lambda j: j.walltime or '',
+   'memory': lambda j: j.memory or '',
+   'submit_time': lambda j: j.submit_time or datetime.min,
+   'start_time': lambda j: j.start_time or datetime.min,
+   'priority': operator.attrgetter('priority'),
+   'cores': lambda j: j.estimated_total_cores(),
+   'score': lambda j: j.score if j.score is not None else -1,  # Put jobs without scores at the end
+   'queue_time': _current_queue_seconds
+}
+
+
+# Per-job values that may be needed by both the jobs sort key and a column
+# formatter; computed once per job per invocation
+_DERIVED_JOB_VALUES = {
+   'cores': PBSJob.estimated_total_cores,
+   'runtime': PBSJob.runtime_duration,
+   'queue_time': _current_queue_seconds
+}
 
 
 class BaseCommand(ABC):
    """Base class for CLI commands"""
    
-   def __init__(self, collector: DataCollector, config: Config):
+   def __init__(self, collector: "DataCollector", config: Config):
       self.collector = collector
       self.config = config
       self.logger = logging.getLogger(__name__)
@@ -56,76 +152,75 @@ class BaseCommand(ABC):
       else:
          console_width = config.display.max_table_width
       
-      self.console = Console(
-         width=console_width,
-         force_terminal=True if config.display.use_colors else False
-      )
+      self.console = _get_console(console_width, config.display.use_colors)
    
    @abstractmethod
    def execute(self, args: argparse.Namespace) -> int:
       """Execute the command"""
       pass
    
-   def _create_table(self, title: str, headers: List[str], rows: List[List[str]]) -> Table:
+   def _create_table(self, title: str, headers: List[str], rows: Iterable[List[str]]) -> Table:
       """Create a rich table with intelligent column sizing"""
-      # Calculate optimal column widths
-      column_widths = self._calculate_column_widths(headers, rows)
-      
       # Create table with better sizing options
       table = Table(
          title=title, 
          show_header=True, 
-         header_style="bold magenta",
+         header_style=_HEADER_STYLE,
          expand=self.config.display.expand_columns,
          width=None if self.config.display.auto_width else self.config.display.max_table_width
       )
       
-      # Add columns with calculated widths
-      for i, header in enumerate(headers):
-         width = column_widths[i] if i < len(column_widths) else None
+      for header in headers:
          table.add_column(
             header, 
-            style="cyan",
-            width=width,
+            style=_COLUMN_STYLE,
             min_width=self.config.display.min_column_width,
             max_width=self.config.display.max_column_width,
             no_wrap=not self.config.display.word_wrap
          )
       
+      # Rows are consumed in a single pass, tracking content widths as they
+      # are added so generators can be streamed without building a list first
+      content_widths = [len(header) for header in headers]
+      has_rows = False
       for row in rows:
+         has_rows = True
+         for i, cell in enumerate(row[:len(content_widths)]):
+            if cell:
+               content_widths[i] = max(content_widths[i], len(str(cell)))
          table.add_row(*row)
       
+      # Apply calculated widths
+      for column, width in zip(table.columns, self._calculate_column_widths(content_widths, has_rows)):
+         column.width = width
+      
       return table
    
-   def _calculate_column_widths(self, headers: List[str], rows: List[List[str]]) -> List[int]:
-      """Calculate optimal column widths based on content"""
-      if not rows:
-         return [len(header) + 2 for header in headers]
-      
-      column_widths = []
-      for i, header in enumerate(headers):
-         # Start with header length
-         max_width = len(header)
-         
-         # Check content in this column
-         for row in rows:
-            if i < len(row) and row[i]:
-               content_width = len(str(row[i]))
-               max_width = max(max_width, content_width)
-         
-         # Apply constraints
-         optimal_width = min(
-            max(max_width + 2, self.config.display.min_column_width),
+   def _calculate_column_widths(self, content_widths: List[int], has_rows: bool) -> List[int]:
+      """Calculate optimal column widths from the widest content in each column"""
+      if not has_rows:
+         return [width + 2 for width in content_widths]
+      
+      # Apply constraints
+      return [
+         min(
+            max(width + 2, self.config.display.min_column_width),
             self.config.display.max_column_width
          )
-         
-         column_widths.append(optimal_width)
-      
-      return column_widths
+         for width in content_widths
+      ]
    
-   def _print_table(self, title: str, headers: List[str], rows: List[List[str]]) -> None:
+   def _print_plain_table(self, title: str, headers: List[str], rows: Iterable[List[Any]]) -> None:
+      """Print the title and an aligned table without borders or styling for piped output"""
+      print(f"\n{title}")
+      print(tabulate(rows, headers=headers, tablefmt="plain", disable_numparse=True))
+   
+   def _print_table(self, title: str, headers: List[str], rows: Iterable[List[str]]) -> None:
       """Print a formatted table with better width handling"""
-      if self.config.display.use_colors:
+      if not sys.stdout.isatty():
+         # Output is piped or redirected, so skip Rich rendering
+         self._print_plain_table(title, headers, rows)
+      elif self.config.display.use_colors:
          table = self._create_table(title, headers, rows)
          self.console.print(table)
       else:
@@ -133,17 +228,11 @@ class BaseCommand(ABC):
          
          # For non-colored output, optionally truncate wide columns
          if not self.config.display.expand_columns:
-            truncated_rows = []
-            for row in rows:
-               truncated_row = []
-               for i, cell in enumerate(row):
-                  if len(str(cell)) > self.config.display.max_column_width:
-                     truncated_cell = str(cell)[:self.config.display.max_column_width-3] + "..."
-                  else:
-                     truncated_cell = str(cell)
-                  truncated_row.append(truncated_cell)
-               truncated_rows.append(truncated_row)
-            rows = truncated_rows
+            max_width = self.config.display.max_column_width
+            rows = (
+               [str(cell)[:max_width-3] + "..." if len(str(cell)) > max_width else str(cell) for cell in row]
+               for row in rows
+            )
          
          print(tabulate(rows, headers=headers, tablefmt="grid"))
    
@@ -175,45 +264,44 @@ class StatusCommand(BaseCommand):
          # Get system summary
          summary = self.collector.get_system_summary()
          
-         print(f"PBS System Status - {format_timestamp(summary['timestamp'])}")
-         print("=" * 60)
-         
-         # Job statistics
+         # Build the whole block and emit it with a single write
          jobs = summary['jobs']
-         print(f"\nJobs:")
-         print(f"  Total: {jobs['total']}")
-         print(f"  Running: {jobs['running']}")
-         print(f"  Queued: {jobs['queued']}")
-         print(f"  Held: {jobs['held']}")
-         print(f"  Other: {jobs['other']}")
-         
-         # Queue statistics
          queues = summary['queues']
-         print(f"\nQueues:")
-         print(f"  Total: {queues['total']}")
-         print(f"  Enabled: {queues['enabled']}")
-         print(f"  Disabled: {queues['disabled']}")
-         
-         # Node statistics
          nodes = summary['nodes']
-         print(f"\nNodes:")
-         print(f"  Total: {nodes['total']}")
-         print(f"  Available: {nodes['available']}")
-         print(f"  Busy: {nodes['busy']}")
-         print(f"  Offline: {nodes['offline']}")
-         
-         # Resource statistics
          resources = summary['resources']
-         print(f"\nResources:")
-         print(f"  Total Cores: {resources['total_cores']}")
-         print(f"  Used Cores: {resources['used_cores']}")
-         print(f"  Available Cores: {resources['available_cores']}")
-         print(f"  Utilization: {format_percentage(resources['utilization'])}")
-         
-         # Queue depth statistics
          queue_depth = summary['queue_depth']
-         print(f"\nQueue Depth:")
-         print(f"  Total Node-Hours Waiting: {queue_depth['total_node_hours']:.1f}")
+         out = [
+            f"PBS System Status - {format_timestamp(summary['timestamp'])}",
+            "=" * 60,
+            # Job statistics
+            "\nJobs:",
+            f"  Total: {jobs['total']}",
+            f"  Running: {jobs['running']}",
+            f"  Queued: {jobs['queued']}",
+            f"  Held: {jobs['held']}",
+            f"  Other: {jobs['other']}",
+            # Queue statistics
+            "\nQueues:",
+            f"  Total: {queues['total']}",
+            f"  Enabled: {queues['enabled']}",
+            f"  Disabled: {queues['disabled']}",
+            # Node statistics
+            "\nNodes:",
+            f"  Total: {nodes['total']}",
+            f"  Available: {nodes['available']}",
+            f"  Busy: {nodes['busy']}",
+            f"  Offline: {nodes['offline']}",
+            # Resource statistics
+            "\nResources:",
+            f"  Total Cores: {resources['total_cores']}",
+            f"  Used Cores: {resources['used_cores']}",
+            f"  Available Cores: {resources['available_cores']}",
+            f"  Utilization: {format_percentage(resources['utilization'])}",
+            # Queue depth statistics
+            "\nQueue Depth:",
+            f"  Total Node-Hours Waiting: {queue_depth['total_node_hours']:.1f}",
+         ]
+         sys.stdout.write("\n".join(out) + "\n")
          
          # Show detailed queue depth breakdown if requested
          if args.queue_depth:
@@ -291,7 +379,7 @@ class JobsCommand(BaseCommand):
       
       # Filter by state if specified
       if args.state:
-         jobs = [job for job in jobs if job.state.value == args.state]
+         jobs = [job for job in jobs if _JOB_STATE_STR[job.state] == args.state]
       
       if not jobs:
          print("No jobs found")
@@ -309,48 +397,53 @@ class JobsCommand(BaseCommand):
          # Default sort direction - descending for score, ascending for others
          reverse_sort = (sort_key == 'score')
       
-      # Define sort key functions
-      sort_functions = {
-         'job_id': lambda j: j.job_id,
-         'name': lambda j: j.job_name.lower(),
-         'owner': lambda j: j.owner.lower(),
-         'project': lambda j: (j.project or '').lower(),
-         'allocation': lambda j: (j.allocation_type or '').lower(),
-         'state': lambda j: j.state.value,
-         'queue': lambda j: j.queue.lower(),
-         'nodes': lambda j: j.nodes,
-         'ppn': lambda j: j.ppn,
-         'walltime': lambda j: j.walltime or '',
-         'memory': lambda j: j.memory or '',
-         'submit_time': lambda j: j.submit_time or datetime.min,
-         'start_time': lambda j: j.start_time or datetime.min,
-         'priority': lambda j: j.priority,
-         'cores': lambda j: j.estimated_total_cores(),
-         'score': lambda j: j.score if j.score is not None else -1,  # Put jobs without scores at the end
-         'queue_time': lambda j: self._calculate_current_queue_seconds(j)
-      }
-      
-      if sort_key in sort_functions:
-         try:
-            jobs.sort(key=sort_functions[sort_key], reverse=reverse_sort)
-         except Exception as e:
-            self.logger.warning(f"Failed to sort by {sort_key}: {str(e)}")
-      else:
+      if sort_key not in _JOB_SORT_KEYS:
          self.logger.warning(f"Unknown sort key: {sort_key}, using default (score)")
-         jobs.sort(key=sort_functions['score'], reverse=True)
+         sort_key = 'score'
+         reverse_sort = True
       
       # Determine columns
       columns = args.columns.split(',') if args.columns else self.config.display.default_job_columns
       
+      # Precompute derived per-job values in a single pass so the sort key and
+      # the column formatters share them for the rest of this invocation
+      derived = {key: {} for key in _DERIVED_JOB_VALUES if key == sort_key or key in columns}
+      if derived:
+         getters = [(values, _DERIVED_JOB_VALUES[key]) for key, values in derived.items()]
+         for job in jobs:
+            job_key = id(job)
+            for values, getter in getters:
+               values[job_key] = getter(job)
+      
+      sort_function = _JOB_SORT_KEYS[sort_key]
+      if sort_key in derived:
+         sort_values = derived[sort_key]
+         sort_function = lambda j: sort_values[id(j)]
+      
+      total_jobs = len(jobs)
+      limit = getattr(args, 'limit', None)
+      try:
+         if limit and limit < total_jobs:
+            # Only the top N rows are shown, so select them in O(N log K) instead of sorting everything
+            select = heapq.nlargest if reverse_sort else heapq.nsmallest
+            jobs = select(limit, jobs, key=sort_function)
+            # Notice goes to stderr so piped output stays plain rows
+            print(f"Showing top {limit} jobs by {sort_key} (use --limit to adjust)", file=sys.stderr)
+         else:
+            jobs = sorted(jobs, key=sort_function, reverse=reverse_sort)
+      except Exception as e:
+         self.logger.warning(f"Failed to sort by {sort_key}: {str(e)}")
+         if limit:
+            jobs = jobs[:limit]
+      
       # Create table data
-      headers = []
       column_formatters = {
          'job_id': lambda j: format_job_id(j.job_id),
          'name': lambda j: j.job_name[:self.config.display.max_name_length] if self.config.display.truncate_long_names else j.job_name,
          'owner': lambda j: j.owner,
          'project': lambda j: j.project or "N/A",
          'allocation': lambda j: j.allocation_type or "N/A",
-         'state': lambda j: format_state(j.state.value),
+         'state': lambda j: format_state(_JOB_STATE_STR[j.state]),
          'queue': lambda j: j.queue,
          'nodes': lambda j: format_number(j.nodes),
          'ppn': lambda j: format_number(j.ppn),
@@ -358,28 +451,20 @@ class JobsCommand(BaseCommand):
          'memory': lambda j: format_memory(j.memory),
          'submit_time': lambda j: format_timestamp(j.submit_time),
          'start_time': lambda j: format_timestamp(j.start_time),
-         'runtime': lambda j: j.runtime_duration() or 'N/A',
+         'runtime': lambda j: derived['runtime'][id(j)] or 'N/A',
          'priority': lambda j: format_number(j.priority),
-         'cores': lambda j: format_number(j.estimated_total_cores()),
-                  'score': lambda j: j.format_score(),
-         'queue_time': lambda j: self._format_queue_time(j)
+         'cores': lambda j: format_number(derived['cores'][id(j)]),
+         'score': lambda j: j.format_score(),
+         'queue_time': lambda j: self._format_queue_time(j, derived['queue_time'][id(j)])
       }
 
-      # Build headers and rows
-      for col in columns:
-         if col in column_formatters:
-            headers.append(col.replace('_', ' ').title())
-      
-      rows = []
-      for job in jobs:
-         row = []
-         for col in columns:
-            if col in column_formatters:
-               row.append(column_formatters[col](job))
-         rows.append(row)
+      # Build headers and stream rows
+      active_columns = [col for col in columns if col in column_formatters]
+      headers = [col.replace('_', ' ').title() for col in active_columns]
+      rows = _iter_rows(jobs, [column_formatters[col] for col in active_columns])
       
       # Print table
-      self._print_table(f"Jobs ({len(jobs)} total)", headers, rows)
+      self._print_table(f"Jobs ({total_jobs} total)", headers, rows)
       
       # Handle database collection if requested
       self._handle_collection_if_requested(args)
@@ -388,26 +473,12 @@ class JobsCommand(BaseCommand):
    
    def _calculate_current_queue_seconds(self, job: PBSJob) -> int:
       """Calculate current queue time in seconds for sorting"""
-      from datetime import datetime
-      
-      if not job.submit_time:
-         return -1
-      
-      # For completed/running jobs, use queue_time_seconds if available
-      if job.queue_time_seconds is not None:
-         return job.queue_time_seconds
-      
-      # For jobs still in queue, calculate against current time
-      if job.state.value in ['Q', 'H', 'W']:  # Queued, Held, or Waiting states
-         now = datetime.now(job.submit_time.tzinfo)  # Use same timezone as submit_time
-         queue_duration = now - job.submit_time
-         return int(queue_duration.total_seconds())
-      
-      return -1
+      return _current_queue_seconds(job)
 
-   def _format_queue_time(self, job: PBSJob) -> str:
+   def _format_queue_time(self, job: PBSJob, seconds: Optional[int] = None) -> str:
       """Format queue time, using current time for jobs still in queue"""
-      seconds = self._calculate_current_queue_seconds(job)
+      if seconds is None:
+         seconds = self._calculate_current_queue_seconds(job)
       if seconds >= 0:
          return format_duration(seconds)
       return "N/A"
@@ -483,14 +554,13 @@ class JobsCommand(BaseCommand):
       columns = args.columns.split(',') if args.columns else self.config.display.default_job_columns
       
       # Create table data
-      headers = []
       column_formatters = {
          'job_id': lambda j: format_job_id(j.job_id),
          'name': lambda j: j.job_name[:self.config.display.max_name_length] if self.config.display.truncate_long_names else j.job_name,
          'owner': lambda j: j.owner,
          'project': lambda j: j.project or "N/A",
          'allocation': lambda j: j.allocation_type or "N/A",
-         'state': lambda j: format_state(j.state.value),
+         'state': lambda j: format_state(_JOB_STATE_STR[j.state]),
          'queue': lambda j: j.queue,
          'nodes': lambda j: format_number(j.nodes),
          'ppn': lambda j: format_number(j.ppn),
@@ -509,18 +579,10 @@ class JobsCommand(BaseCommand):
          'execution_node': lambda j: j.execution_node or "N/A"
       }
       
-      # Build headers and rows
-      for col in columns:
-         if col in column_formatters:
-            headers.append(col.replace('_', ' ').title())
-      
-      rows = []
-      for job in jobs:
-         row = []
-         for col in columns:
-            if col in column_formatters:
-               row.append(column_formatters[col](job))
-         rows.append(row)
+      # Build headers and stream rows
+      active_columns = [col for col in columns if col in column_formatters]
+      headers = [col.replace('_', ' ').title() for col in active_columns]
+      rows = _iter_rows(jobs, [column_formatters[col] for col in active_columns])
       
       # Print table
       self._print_table(f"Job Details ({len(jobs)} jobs)", headers, rows)
@@ -627,7 +689,7 @@ class JobsCommand(BaseCommand):
          print(f"  Runtime: {job.runtime_duration()}")
       
       # Resource Usage (for completed jobs)
-      if job.state.value in ['C', 'F', 'E']:
+      if job.state in _FINISHED_JOB_STATES:
          print(f"\n📊 Resource Usage:")
          actual_walltime = self._get_actual_walltime(job)
          if actual_walltime:
@@ -747,7 +809,7 @@ class NodesCommand(BaseCommand):
          
          # Filter by state if specified
          if args.state:
-            nodes = [node for node in nodes if node.state.value == args.state]
+            nodes = [node for node in nodes if _NODE_STATE_STR[node.state] == args.state]
          
          if not nodes:
             print("No nodes found")
@@ -773,10 +835,9 @@ class NodesCommand(BaseCommand):
       columns = args.columns.split(',') if args.columns else self.config.display.default_node_columns
       
       # Create table data
-      headers = []
       column_formatters = {
          'name': lambda n: n.name,
-         'state': lambda n: format_state(n.state.value),
+         'state': lambda n: format_state(_NODE_STATE_STR[n.state]),
          'ncpus': lambda n: format_number(n.ncpus),
          'memory': lambda n: format_memory(n.memory),
          'jobs': lambda n: format_number(len(n.jobs)),
@@ -786,18 +847,10 @@ class NodesCommand(BaseCommand):
          'properties': lambda n: ', '.join(n.properties[:3]) + ('...' if len(n.properties) > 3 else '')
       }
       
-      # Build headers and rows
-      for col in columns:
-         if col in column_formatters:
-            headers.append(col.replace('_', ' ').title())
-      
-      rows = []
-      for node in nodes:
-         row = []
-         for col in columns:
-            if col in column_formatters:
-               row.append(column_formatters[col](node))
-         rows.append(row)
+      # Build headers and stream rows
+      active_columns = [col for col in columns if col in column_formatters]
+      headers = [col.replace('_', ' ').title() for col in active_columns]
+      rows = _iter_rows(nodes, [column_formatters[col] for col in active_columns])
       
       # Print table
       self._print_table(f"Nodes ({len(nodes)} total)", headers, rows)
@@ -810,37 +863,41 @@ class NodesCommand(BaseCommand):
    def _show_node_summary(self, nodes: List[PBSNode], args: argparse.Namespace) -> int:
       """Show node summary (new default behavior)"""
       
-      # Calculate summary statistics
-      summary_stats = self._calculate_node_summary(nodes)
+      # Calculate summary statistics, attention items and per-state resources in one pass
+      summary_stats, attention_items, per_state_resources = self._build_node_report(nodes)
       
-      # Print overall summary
-      print(f"Node Summary - {format_timestamp(datetime.now())}")
-      print("=" * 50)
-      print(f"Total Nodes: {summary_stats['total_nodes']}")
+      # Build the summary prologue and emit it with a single write
+      total_nodes = summary_stats['total_nodes']
+      out = [
+         f"Node Summary - {format_timestamp(datetime.now())}",
+         "=" * 50,
+         f"Total Nodes: {total_nodes}",
+      ]
       
-      # Print state breakdown with percentages
-      state_stats = summary_stats['state_breakdown']
-      for state, count in state_stats.items():
-         percentage = (count / summary_stats['total_nodes']) * 100
-         print(f"  └─ {state.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
+      # State breakdown with percentages
+      for state, count in summary_stats['state_breakdown'].items():
+         percentage = (count / total_nodes) * 100
+         out.append(f"  └─ {state.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
       
-      # Print resource summary
+      # Resource summary
       resources = summary_stats['resources']
-      print(f"\nResources:")
-      print(f"  └─ Total CPUs: {format_number(resources['total_cpus'])}")
-      print(f"  └─ Used CPUs: {format_number(resources['used_cpus'])}")
-      print(f"  └─ Available CPUs: {format_number(resources['available_cpus'])}")
-      print(f"  └─ CPU Utilization: {format_percentage(resources['cpu_utilization'])}")
+      out.append("\nResources:")
+      out.append(f"  └─ Total CPUs: {format_number(resources['total_cpus'])}")
+      out.append(f"  └─ Used CPUs: {format_number(resources['used_cpus'])}")
+      out.append(f"  └─ Available CPUs: {format_number(resources['available_cpus'])}")
+      out.append(f"  └─ CPU Utilization: {format_percentage(resources['cpu_utilization'])}")
       
       if resources['total_memory_gb']:
-         print(f"  └─ Total Memory: {resources['total_memory_gb']:.1f} TB")
-         print(f"  └─ Used Memory: {resources['used_memory_gb']:.1f} TB")
-         print(f"  └─ Available Memory: {resources['available_memory_gb']:.1f} TB")
-         print(f"  └─ Memory Utilization: {format_percentage(resources['memory_utilization'])}")
+         out.append(f"  └─ Total Memory: {resources['total_memory_gb']:.1f} TB")
+         out.append(f"  └─ Used Memory: {resources['used_memory_gb']:.1f} TB")
+         out.append(f"  └─ Available Memory: {resources['available_memory_gb']:.1f} TB")
+         out.append(f"  └─ Memory Utilization: {format_percentage(resources['memory_utilization'])}")
+      
+      out.append("\nState Breakdown:")
+      sys.stdout.write("\n".join(out) + "\n")
       
       # Print state breakdown table
-      print(f"\nState Breakdown:")
-      self._print_state_breakdown_table(summary_stats)
+      self._print_state_breakdown_table(summary_stats, per_state_resources)
       
       # Print hardware types summary
       if summary_stats['hardware_types']:
@@ -848,7 +905,6 @@ class NodesCommand(BaseCommand):
          self._print_hardware_types_table(summary_stats['hardware_types'])
       
       # Print attention items
-      attention_items = self._get_attention_items(nodes, summary_stats)
       if attention_items:
          print(f"\nAttention Required:")
          for item in attention_items:
@@ -859,58 +915,110 @@ class NodesCommand(BaseCommand):
       
       return 0
    
-   def _calculate_node_summary(self, nodes: List[PBSNode]) -> Dict[str, Any]:
-      """Calculate comprehensive node summary statistics"""
-      
-      # Initialize counters
-      state_counts = {}
-      total_cpus = 0
-      used_cpus = 0
-      total_memory_gb = 0.0
-      used_memory_gb = 0.0
-      hardware_types = {}
+   def _build_node_report(self, nodes: List[PBSNode]) -> Tuple[Dict[str, Any], List[str], Dict[str, Dict[str, Any]]]:
+      """
+      Calculate node summary statistics, attention items and per-state resources
+      
+      Per-node values are gathered in a single traversal of the node list and
+      then reduced with reduce_nodes (np.bincount).
+      
+      Args:
+         nodes: Nodes to summarize
+         
+      Returns:
+         Tuple of (summary_stats, attention_items, per_state_resources)
+      """
+      
+      # NumPy is only needed by the nodes command, so it is imported here
+      import numpy as np
+      from ..utils._node_reduce import reduce_nodes
+      
+      # Gather per-node values into plain lists and convert each to an array
+      # once; string keys are mapped to small integer IDs in first-seen order
+      # so the reduction is purely numeric
+      ncpus_list = []
+      jobs_list = []
+      mem_list = []
+      occupied_list = []
+      state_list = []
+      hw_list = []
+      state_index = {}
+      hw_index = {}
+      # Distinct job IDs per state; node.jobs lists one entry per occupied core
+      state_job_ids = {}
+      high_load_count = 0
+      cleanup_count = 0
       
-      # Process each node
       for node in nodes:
-         # Count by state
-         state_key = node.state.value.replace('-', '_')
-         state_counts[state_key] = state_counts.get(state_key, 0) + 1
-         
-         # Resource calculations
-         total_cpus += node.ncpus
-         used_cpus += len(node.jobs)
-         
-         # Memory calculations
-         memory_gb = node.memory_gb()
-         if memory_gb:
-            total_memory_gb += memory_gb
-            if node.is_occupied():
-               # Estimate used memory proportionally
-               used_memory_gb += memory_gb * (len(node.jobs) / node.ncpus) if node.ncpus > 0 else 0
+         ncpus_list.append(node.ncpus)
+         jobs_list.append(len(node.jobs))
+         mem_list.append(node.memory_gb() or 0.0)
+         occupied_list.append(node.is_occupied())
+         
+         state_key = _NODE_STATE_KEY[node.state]
+         state_list.append(state_index.setdefault(state_key, len(state_index)))
+         if node.jobs:
+            state_job_ids.setdefault(state_key, set()).update(
+               job.split('/')[0] for job in node.jobs
+            )
          
          # Hardware type classification
-         cpu_type = node.raw_attributes.get('resources_available', {}).get('cputype', 'unknown')
-         gpu_type = node.raw_attributes.get('resources_available', {}).get('gputype', 'none')
-         hw_key = f"{cpu_type}/{gpu_type}"
-         
-         if hw_key not in hardware_types:
-            hardware_types[hw_key] = {
-               'count': 0,
-               'cpus': 0,
-               'memory_gb': 0.0,
-               'used_cpus': 0
-            }
-         
-         hardware_types[hw_key]['count'] += 1
-         hardware_types[hw_key]['cpus'] += node.ncpus
-         hardware_types[hw_key]['memory_gb'] += memory_gb or 0
-         hardware_types[hw_key]['used_cpus'] += len(node.jobs)
+         resources_available = node.raw_attributes.get('resources_available', {})
+         cpu_type = resources_available.get('cputype', 'unknown')
+         gpu_type = resources_available.get('gputype', 'none')
+         hw_list.append(hw_index.setdefault(f"{cpu_type}/{gpu_type}", len(hw_index)))
+         
+         # Nodes with high load
+         load = node.load_percentage()
+         if load and load > 90:
+            high_load_count += 1
+         
+         # Nodes with job cleanup issues (comment mentions cleanup)
+         comment = node.raw_attributes.get('comment', '').lower()
+         if 'cleanup' in comment or 'not cleaned' in comment:
+            cleanup_count += 1
+      
+      ncpus = np.asarray(ncpus_list, dtype=np.int64)
+      jobs_per = np.asarray(jobs_list, dtype=np.int64)
+      mem_gb = np.asarray(mem_list, dtype=np.float64)
+      occupied = np.asarray(occupied_list, dtype=np.bool_)
+      state_ids = np.asarray(state_list, dtype=np.int64)
+      hw_ids = np.asarray(hw_list, dtype=np.int64)
+      
+      (state_counts_arr, state_cpus, state_mem,
+       hw_counts, hw_cpus, hw_mem, hw_used, used_memory_gb) = reduce_nodes(
+         ncpus, jobs_per, mem_gb, occupied, state_ids, hw_ids, len(state_index), len(hw_index)
+      )
+      
+      state_counts = {}
+      per_state_resources = {}
+      for state_key, sid in state_index.items():
+         state_counts[state_key] = int(state_counts_arr[sid])
+         per_state_resources[state_key] = {
+            'cpus': int(state_cpus[sid]),
+            'memory_gb': float(state_mem[sid]),
+            'jobs': len(state_job_ids.get(state_key, ()))
+         }
+      
+      hardware_types = {}
+      for hw_key, hid in hw_index.items():
+         hardware_types[hw_key] = {
+            'count': int(hw_counts[hid]),
+            'cpus': int(hw_cpus[hid]),
+            'memory_gb': float(hw_mem[hid]),
+            'used_cpus': int(hw_used[hid])
+         }
+      
+      total_cpus = int(ncpus.sum())
+      used_cpus = int(jobs_per.sum())
+      total_memory_gb = float(mem_gb.sum())
+      used_memory_gb = float(used_memory_gb)
       
       # Calculate utilization percentages
       cpu_utilization = (used_cpus / total_cpus * 100) if total_cpus > 0 else 0
       memory_utilization = (used_memory_gb / total_memory_gb * 100) if total_memory_gb > 0 else 0
       
-      return {
+      summary_stats = {
          'total_nodes': len(nodes),
          'state_breakdown': state_counts,
          'resources': {
@@ -925,41 +1033,38 @@ class NodesCommand(BaseCommand):
          },
          'hardware_types': hardware_types
       }
+      
+      attention_items = self._get_attention_items(summary_stats, high_load_count, cleanup_count)
+      
+      return summary_stats, attention_items, per_state_resources
    
-   def _print_state_breakdown_table(self, summary_stats: Dict[str, Any]) -> None:
+   def _print_state_breakdown_table(self, summary_stats: Dict[str, Any],
+                                    per_state_resources: Dict[str, Dict[str, Any]]) -> None:
       """Print state breakdown table"""
       
       state_data = []
-      total_nodes = summary_stats['total_nodes']
       
       for state, count in summary_stats['state_breakdown'].items():
-         # Calculate resources for this state
-         state_cpus = 0
-         state_memory = 0.0
-         state_jobs = 0
-         
-         # We need to recalculate from original nodes for accurate per-state data
-         # For now, use proportional estimates
-         cpu_ratio = count / total_nodes
-         state_cpus = int(summary_stats['resources']['total_cpus'] * cpu_ratio)
-         
-         if summary_stats['resources']['total_memory_gb']:
-            state_memory = summary_stats['resources']['total_memory_gb'] * cpu_ratio
+         state_resources = per_state_resources[state]
+         state_memory = state_resources['memory_gb'] / 1024  # Convert to TB
          
          state_data.append([
             state.replace('_', ' ').title(),
             format_number(count),
-            format_number(state_cpus),
+            format_number(state_resources['cpus']),
             f"{state_memory:.1f} TB" if state_memory > 0 else "N/A",
-            "N/A"  # Jobs per state would need more complex calculation
+            format_number(state_resources['jobs'])
          ])
       
       headers = ["State", "Count", "CPUs", "Memory", "Running Jobs"]
       
-      if self.config.display.use_colors:
-         table = Table(title="State Breakdown", show_header=True, header_style="bold magenta")
+      if not sys.stdout.isatty():
+         # The section heading is already printed, so only the table is needed
+         print(tabulate(state_data, headers=headers, tablefmt="plain", disable_numparse=True))
+      elif self.config.display.use_colors:
+         table = Table(title="State Breakdown", show_header=True, header_style=_HEADER_STYLE)
          for header in headers:
-            table.add_column(header, style="cyan")
+            table.add_column(header, style=_COLUMN_STYLE)
          for row in state_data:
             table.add_row(*row)
          self.console.print(table)
@@ -982,17 +1087,20 @@ class NodesCommand(BaseCommand):
       
       headers = ["Type (CPU/GPU)", "Count", "CPUs", "Memory", "Utilization"]
       
-      if self.config.display.use_colors:
-         table = Table(title="Hardware Types", show_header=True, header_style="bold magenta")
+      if not sys.stdout.isatty():
+         print(tabulate(hw_data, headers=headers, tablefmt="plain", disable_numparse=True))
+      elif self.config.display.use_colors:
+         table = Table(title="Hardware Types", show_header=True, header_style=_HEADER_STYLE)
          for header in headers:
-            table.add_column(header, style="cyan")
+            table.add_column(header, style=_COLUMN_STYLE)
          for row in hw_data:
             table.add_row(*row)
          self.console.print(table)
       else:
          print(tabulate(hw_data, headers=headers, tablefmt="grid"))
    
-   def _get_attention_items(self, nodes: List[PBSNode], summary_stats: Dict[str, Any]) -> List[str]:
+   def _get_attention_items(self, summary_stats: Dict[str, Any], high_load_count: int,
+                            cleanup_count: int) -> List[str]:
       """Generate list of items requiring attention"""
       
       attention_items = []
@@ -1005,15 +1113,12 @@ class NodesCommand(BaseCommand):
             attention_items.append(f"{offline_count} nodes offline ({offline_pct:.1f}% of cluster)")
       
       # Check for nodes with high load
-      high_load_nodes = [n for n in nodes if n.load_percentage() and n.load_percentage() > 90]
-      if high_load_nodes:
-         attention_items.append(f"{len(high_load_nodes)} nodes with high load (>90%)")
+      if high_load_count:
+         attention_items.append(f"{high_load_count} nodes with high load (>90%)")
       
-      # Check for nodes with job cleanup issues (nodes with comment containing cleanup info)
-      cleanup_nodes = [n for n in nodes if n.raw_attributes.get('comment', '').lower().find('cleanup') >= 0 or 
-                      n.raw_attributes.get('comment', '').lower().find('not cleaned') >= 0]
-      if cleanup_nodes:
-         attention_items.append(f"{len(cleanup_nodes)} nodes with job cleanup issues")
+      # Check for nodes with job cleanup issues
+      if cleanup_count:
+         attention_items.append(f"{cleanup_count} nodes with job cleanup issues")
       
       # Check for down nodes
       down_count = summary_stats['state_breakdown'].get('down', 0)
@@ -1043,7 +1148,6 @@ class QueuesCommand(BaseCommand):
          columns = args.columns.split(',') if args.columns else self.config.display.default_queue_columns
          
          # Create table data
-         headers = []
          column_formatters = {
             'name': lambda q: q.name,
             'status': lambda q: q.status_description(),
@@ -1060,18 +1164,10 @@ class QueuesCommand(BaseCommand):
             'max_nodes': lambda q: format_number(q.max_nodes) if q.max_nodes is not None else "∞"
          }
          
-         # Build headers and rows
-         for col in columns:
-            if col in column_formatters:
-               headers.append(col.replace('_', ' ').title())
-         
-         rows = []
-         for queue in queues:
-            row = []
-            for col in columns:
-               if col in column_formatters:
-                  row.append(column_formatters[col](queue))
-            rows.append(row)
+         # Build headers and stream rows
+         active_columns = [col for col in columns if col in column_formatters]
+         headers = [col.replace('_', ' ').title() for col in active_columns]
+         rows = _iter_rows(queues, [column_formatters[col] for col in active_columns])
          
          # Print table
          self._print_table(f"Queues ({len(queues)} total)", headers, rows)
@@ -1155,6 +1251,7 @@ class DatabaseCommand(BaseCommand):
             return 0
       
       try:
+         from ..database.migrations import initialize_database
          initialize_database(self.config)
          print("Database initialized successfully")
          return 0
@@ -1167,6 +1264,7 @@ class DatabaseCommand(BaseCommand):
       print("Migrating database to latest schema...")
       
       try:
+         from ..database.migrations import migrate_database
          migrate_database(self.config)
          print("Database migration completed successfully")
          return 0
@@ -1177,6 +1275,7 @@ class DatabaseCommand(BaseCommand):
    def _show_database_status(self, args: argparse.Namespace) -> int:
       """Show database status"""
       try:
+         from ..database.migrations import get_database_info
          info = get_database_info(self.config)
          
          print("Database Information")
@@ -1218,6 +1317,7 @@ class DatabaseCommand(BaseCommand):
       print("Validating database schema...")
       
       try:
+         from ..database.migrations import validate_database
          validation = validate_database(self.config)
          
          if validation['valid']:
@@ -1252,6 +1352,7 @@ class DatabaseCommand(BaseCommand):
       backup_path = getattr(args, 'backup_path', None)
       
       try:
+         from ..database.migrations import backup_database
          result_path = backup_database(backup_path, self.config)
          print(f"Database backed up to: {result_path}")
          return 0
@@ -1273,6 +1374,7 @@ class DatabaseCommand(BaseCommand):
          return 0
       
       try:
+         from ..database.migrations import restore_database
          restore_database(args.backup_path, self.config)
          print("Database restored successfully")
          return 0
@@ -1296,6 +1398,7 @@ class DatabaseCommand(BaseCommand):
             return 0
       
       try:
+         from ..database.migrations import clean_old_data
          results = clean_old_data(job_history_days, snapshot_days, self.config)
          
          print("Cleanup completed:")
@@ -1515,7 +1618,7 @@ class HistoryCommand(BaseCommand):
          
          # Filter by state if specified
          if args.state != "all":
-            historical_jobs = [job for job in historical_jobs if job.state.value == args.state]
+            historical_jobs = [job for job in historical_jobs if _JOB_STATE_STR[job.state] == args.state]
          
          # Sort jobs BEFORE applying limit to get the top N jobs by sort criteria
          historical_jobs = self._sort_jobs(historical_jobs, args.sort, args.reverse)
@@ -1647,14 +1750,13 @@ class HistoryCommand(BaseCommand):
       columns = args.columns.split(',') if args.columns else default_columns
       
       # Create table data
-      headers = []
       column_formatters = {
          'job_id': lambda j: format_job_id(j.job_id),
          'name': lambda j: j.job_name[:30] + "..." if len(j.job_name) > 30 else j.job_name,
          'owner': lambda j: j.owner,
          'project': lambda j: j.project or "N/A",
          'allocation': lambda j: j.allocation_type or "N/A",
-         'state': lambda j: format_state(j.state.value),
+         'state': lambda j: format_state(_JOB_STATE_STR[j.state]),
          'queue': lambda j: j.queue,
          'nodes': lambda j: format_number(j.nodes),
          'walltime': lambda j: format_duration(j.walltime),
@@ -1667,25 +1769,17 @@ class HistoryCommand(BaseCommand):
          'cores': lambda j: format_number(j.estimated_total_cores())
       }
       
-      # Build headers and rows
-      for col in columns:
-         if col in column_formatters:
-            headers.append(col.replace('_', ' ').title())
-      
-      rows = []
-      for job in jobs:
-         row = []
-         for col in columns:
-            if col in column_formatters:
-               row.append(column_formatters[col](job))
-         rows.append(row)
+      # Build headers and stream rows
+      active_columns = [col for col in columns if col in column_formatters]
+      headers = [col.replace('_', ' ').title() for col in active_columns]
+      rows = _iter_rows(jobs, [column_formatters[col] for col in active_columns])
       
       # Print table
       self._print_table(f"Historical Jobs ({len(jobs)} total)", headers, rows)
       
       # Check if any jobs have incomplete timing data and show explanation
       has_incomplete_data = any(
-         (job.state.value in ['C', 'F', 'E'] and 
+         (job.state in _FINISHED_JOB_STATES and 
           (not job.start_time or not job.end_time or job.exit_status is None))
          for job in jobs
       )
@@ -1703,7 +1797,7 @@ class HistoryCommand(BaseCommand):
          minutes = (total_seconds % 3600) // 60
          seconds = total_seconds % 60
          return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-      elif job.state.value in ['C', 'F', 'E']:  # Completed states
+      elif job.state in _FINISHED_JOB_STATES:  # Completed states
          return "Unknown*"  # Job completed but timing data missing
       else:
          return "N/A"  # Job not completed yet
@@ -1713,7 +1807,7 @@ class HistoryCommand(BaseCommand):
       queue_duration = job.queue_duration()
       if queue_duration:
          return queue_duration
-      elif job.state.value in ['C', 'F', 'E']:  # Completed states
+      elif job.state in _FINISHED_JOB_STATES:  # Completed states
          return "Unknown*"  # Job completed but timing data missing
       else:
          return "N/A"  # Job not completed yet
@@ -1722,7 +1816,7 @@ class HistoryCommand(BaseCommand):
       """Format exit status for display with better error handling"""
       if job.exit_status is not None:
          return str(job.exit_status)
-      elif job.state.value in ['C', 'F', 'E']:  # Completed states
+      elif job.state in _FINISHED_JOB_STATES:  # Completed states
          return "Unknown*"  # Job completed but exit status missing
       else:
          return "N/A"  # Job not completed yet
@@ -1739,7 +1833,7 @@ class HistoryCommand(BaseCommand):
          return format_duration(job.queue_time_seconds)
       
       # For jobs still in queue, calculate against current time
-      if job.state.value in ['Q', 'H', 'W']:  # Queued, Held, or Waiting states
+      if job.state in _PENDING_JOB_STATES:  # Queued, Held, or Waiting states
          now = datetime.now(job.submit_time.tzinfo)  # Use same timezone as submit_time
          queue_duration = now - job.submit_time
          return format_duration(int(queue_duration.total_seconds()))
@@ -1748,18 +1842,14 @@ class HistoryCommand(BaseCommand):
 class DaemonCommand(BaseCommand):
    """Daemon management commands"""
    
-   def __init__(self, collector: DataCollector, config: Config):
+   def __init__(self, collector: "DataCollector", config: Config):
       # For daemon commands, collector might be None
       self.config = config
       self.logger = logging.getLogger(__name__)
       
       # Initialize console for rich output if display config is available
       if hasattr(config, 'display'):
-         from rich.console import Console
-         self.console = Console(
-            width=config.display.max_table_width,
-            force_terminal=True if config.display.use_colors else False
-         )
+         self.console = _get_console(config.display.max_table_width, config.display.use_colors)
       else:
          self.console = None
    
@@ -2203,7 +2293,7 @@ class AnalyzeCommand(BaseCommand):
          self.console.print(f"[red]Error: {str(e)}[/red]")
          return 1
    
-   def _display_run_score_results(self, df: pd.DataFrame, summary: Dict[str, Any], args: argparse.Namespace) -> None:
+   def _display_run_score_results(self, df: "pd.DataFrame", summary: Dict[str, Any], args: argparse.Namespace) -> None:
       """Display run score analysis results"""
       
             # Show summary
@@ -2220,7 +2310,7 @@ class AnalyzeCommand(BaseCommand):
       else:
          self._display_table_output(df)
    
-   def _display_table_output(self, df: pd.DataFrame) -> None:
+   def _display_table_output(self, df: "pd.DataFrame") -> None:
       """Display results in table format"""
       
       # Prepare table data
@@ -2245,7 +2335,7 @@ class AnalyzeCommand(BaseCommand):
       # Add note about data interpretation
       self.console.print(f"\n[dim]Note: Values show Average Score ± Standard Deviation. Sample sizes vary by bin.[/dim]")
    
-   def _display_csv_output(self, df: pd.DataFrame) -> None:
+   def _display_csv_output(self, df: "pd.DataFrame") -> None:
       """Display results in CSV format"""
       
       # Remove count columns for CSV output
@@ -3,24 +3,21 @@ Main CLI entry point for PBS Monitor
 """
 
 import argparse
+import functools
+import importlib
 import sys
-import os
-import logging
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
-from ..config import Config
-from ..utils.logging_setup import setup_logging
-from ..data_collector import DataCollector
-from .commands import StatusCommand, JobsCommand, NodesCommand, QueuesCommand, DatabaseCommand, HistoryCommand, DaemonCommand, ReservationsCommand
-from .analyze_commands import AnalyzeCommand
+from .. import __version__
 
+# Config, DataCollector, logging and the command classes are imported where they
+# are used so that --help and lightweight commands don't pay for the full import graph
+if TYPE_CHECKING:
+   from ..config import Config
 
-def create_parser() -> argparse.ArgumentParser:
-   """Create argument parser for PBS Monitor CLI"""
-   
-   parser = argparse.ArgumentParser(
-      prog="pbs-monitor",
-      description="""PBS scheduler monitoring and management tools
+
+# Help text for the top-level parser
+_DESCRIPTION = """PBS scheduler monitoring and management tools
 
 Configuration file locations (searched in order):
   ~/.pbs_monitor.yaml
@@ -28,9 +25,9 @@ Configuration file locations (searched in order):
   /etc/pbs_monitor/config.yaml
   pbs_monitor.yaml (current directory)
 
-Many command options (columns, display settings, etc.) can be configured in the config file.""",
-      formatter_class=argparse.RawDescriptionHelpFormatter,
-      epilog="""
+Many command options (columns, display settings, etc.) can be configured in the config file."""
+
+_EPILOG = """
 Examples:
   pbs-monitor status              # Show system status
   pbs-monitor jobs                # Show all jobs
@@ -41,9 +38,51 @@ Examples:
   pbs-monitor queues              # Show queue information
   pbs-monitor config --create     # Create sample configuration
       """
+
+# Choice constants shared by every parser build
+_JOB_STATE_CHOICES = ("R", "Q", "H", "W", "T", "E", "S", "C", "F")
+_NODE_STATE_CHOICES = ("free", "offline", "down", "busy", "job-exclusive", "job-sharing")
+_HISTORY_STATE_CHOICES = ("C", "F", "E", "all")
+
+
+def create_parser(command: Optional[str] = None, stubs_only: bool = False) -> argparse.ArgumentParser:
+   """
+   Create argument parser for PBS Monitor CLI
+   
+   The parser is built once per command and reused on later calls, so callers
+   must not modify the returned parser.
+   
+   Args:
+      command: Only build the subparser for this command (all subparsers if None or unknown)
+      stubs_only: Register every command with its one-line help only (enough for
+         top-level --help/--version, which never parse a subcommand)
+      
+   Returns:
+      Configured argument parser
+   """
+   if command not in _SUBPARSER_BUILDERS:
+      command = None
+   return _build_parser(command, stubs_only)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str], stubs_only: bool = False) -> argparse.ArgumentParser:
+   """Build the argument parser (see create_parser)"""
+   
+   parser = argparse.ArgumentParser(
+      prog="pbs-monitor",
+      description=_DESCRIPTION,
+      formatter_class=argparse.RawDescriptionHelpFormatter,
+      epilog=_EPILOG
    )
    
    # Global options
+   parser.add_argument(
+      "--version",
+      action="version",
+      version=f"%(prog)s {__version__}"
+   )
+   
    parser.add_argument(
       "-c", "--config",
       help="Configuration file path",
@@ -99,157 +138,132 @@ Examples:
       help="Enable word wrapping in table cells"
    )
    
+   # Table width options are always present on the parsed namespace
+   parser.set_defaults(max_width=None, auto_width=False, no_expand=False, wrap=False)
+   
    # Create subparsers
    subparsers = parser.add_subparsers(
       dest="command",
       help="Available commands"
    )
    
-   # Status command
-   status_parser = subparsers.add_parser(
-      "status",
-      help="Show PBS system status"
-   )
-   status_parser.add_argument(
-      "-r", "--refresh",
-      action="store_true",
-      help="Force refresh of data"
-   )
-   status_parser.add_argument(
-      "--collect",
-      action="store_true",
-      help="Collect and persist data to database after displaying"
-   )
-   status_parser.add_argument(
-      "--queue-depth",
-      action="store_true",
-      help="Show detailed queue depth breakdown by job size"
-   )
-   
-   # Jobs command
-   jobs_parser = subparsers.add_parser(
-      "jobs",
-      help="Show job information"
-   )
-   jobs_parser.add_argument(
-      "job_ids",
-      nargs="*",
-      help="Specific job IDs to show details for (numerical portion only, e.g., 12345)"
-   )
-   jobs_parser.add_argument(
-      "-u", "--user",
-      help="Filter by username"
-   )
-   jobs_parser.add_argument(
-      "-p", "--project",
-      help="Filter by project name (partial string matching)"
-   )
-   jobs_parser.add_argument(
-      "-s", "--state",
-      choices=["R", "Q", "H", "W", "T", "E", "S", "C", "F"],
-      help="Filter by job state"
-   )
-   jobs_parser.add_argument(
-      "-r", "--refresh",
-      action="store_true",
-      help="Force refresh of data"
-   )
-   jobs_parser.add_argument(
-      "--columns",
-      help="Comma-separated list of columns to display: job_id, name, owner, project, allocation, state, queue, nodes, ppn, walltime, walltime_actual, memory, submit_time, start_time, end_time, runtime, priority, cores, score, queue_time, exit_status, execution_node"
-   )
-   jobs_parser.add_argument(
-      "--sort",
-      default="score",
-      help="Column to sort by: job_id, name, owner, project, allocation, state, queue, nodes, ppn, walltime, priority, cores, score (default: score)"
-   )
-   jobs_parser.add_argument(
-      "--reverse",
-      action="store_true",
-      help="Sort in ascending order (default is descending for score, ascending for others)"
-   )
-   jobs_parser.add_argument(
-      "--collect",
-      action="store_true",
-      help="Collect and persist data to database after displaying"
-   )
-   jobs_parser.add_argument(
-      "-d", "--detailed",
-      action="store_true",
-      help="Show detailed information for specific jobs"
-   )
-   jobs_parser.add_argument(
-      "--history",
-      action="store_true",
-      help="Include job history from database (for detailed view)"
-   )
-   jobs_parser.add_argument(
-      "--format",
-      choices=["table", "detailed", "json"],
-      default="table",
-      help="Output format for job details (default: table)"
-   )
-   jobs_parser.add_argument(
-      "--show-raw",
-      action="store_true",
-      help="Show raw PBS attributes (for detailed view)"
-   )
-   
-   # Nodes command
-   nodes_parser = subparsers.add_parser(
-      "nodes",
-      help="Show node information"
-   )
-   nodes_parser.add_argument(
-      "-s", "--state",
-      choices=["free", "offline", "down", "busy", "job-exclusive", "job-sharing"],
-      help="Filter by node state"
-   )
-   nodes_parser.add_argument(
-      "-r", "--refresh",
-      action="store_true",
-      help="Force refresh of data"
-   )
-   nodes_parser.add_argument(
-      "--columns",
-      help="Comma-separated list of columns to display"
-   )
-   nodes_parser.add_argument(
-      "-d", "--detailed",
-      action="store_true",
-      help="Show detailed table format instead of summary"
-   )
-   nodes_parser.add_argument(
-      "--collect",
-      action="store_true",
-      help="Collect and persist data to database after displaying"
-   )
+   # Build only the requested subparser when the command is known up front; the
+   # others get help-only stubs so usage and error messages still list them
+   selected = _SUBPARSER_BUILDERS.get(command)
+   for name in _COMMAND_HELP:
+      builder = _SUBPARSER_BUILDERS[name]
+      if not stubs_only and (selected is None or builder is selected):
+         builder(subparsers)
+      else:
+         subparsers.add_parser(name, help=_COMMAND_HELP[name], aliases=_COMMAND_ALIASES.get(name, []))
    
-   # Queues command
-   queues_parser = subparsers.add_parser(
-      "queues",
-      help="Show queue information"
-   )
-   queues_parser.add_argument(
-      "-r", "--refresh",
-      action="store_true",
-      help="Force refresh of data"
-   )
-   queues_parser.add_argument(
-      "--columns",
-      help="Comma-separated list of columns to display"
-   )
-   queues_parser.add_argument(
-      "--collect",
-      action="store_true",
-      help="Collect and persist data to database after displaying"
-   )
+   return parser
+
+
+# Top-level commands in help order, with their one-line help
+_COMMAND_HELP = {
+   "status": "Show PBS system status",
+   "jobs": "Show job information",
+   "nodes": "Show node information",
+   "queues": "Show queue information",
+   "resv": "Reservation information and management",
+   "history": "Show historical job information from database",
+   "analyze": "Analytics and analysis commands",
+   "config": "Configuration management",
+   "database": "Database management",
+   "daemon": "Background data collection daemon management",
+}
+
+_COMMAND_ALIASES = {
+   "resv": ["reservations", "reserv"],
+}
+
+# Arguments shared by several subcommands: (flags, add_argument keywords)
+_REFRESH_ARG = (("-r", "--refresh"), dict(action="store_true", help="Force refresh of data"))
+_COLLECT_ARG = (("--collect",), dict(action="store_true", help="Collect and persist data to database after displaying"))
+_COLUMNS_ARG = (("--columns",), dict(help="Comma-separated list of columns to display"))
+
+# Declarative specs for subcommands without nested actions
+_SUBCOMMAND_SPECS = {
+   "status": {
+      "args": [
+         _REFRESH_ARG,
+         _COLLECT_ARG,
+         (("--queue-depth",), dict(action="store_true", help="Show detailed queue depth breakdown by job size")),
+      ]
+   },
+   "jobs": {
+      "args": [
+         (("job_ids",), dict(nargs="*", help="Specific job IDs to show details for (numerical portion only, e.g., 12345)")),
+         (("-u", "--user"), dict(help="Filter by username")),
+         (("-p", "--project"), dict(help="Filter by project name (partial string matching)")),
+         (("-s", "--state"), dict(choices=_JOB_STATE_CHOICES, help="Filter by job state")),
+         _REFRESH_ARG,
+         (("--columns",), dict(help="Comma-separated list of columns to display: job_id, name, owner, project, allocation, state, queue, nodes, ppn, walltime, walltime_actual, memory, submit_time, start_time, end_time, runtime, priority, cores, score, queue_time, exit_status, execution_node")),
+         (("--sort",), dict(default="score", help="Column to sort by: job_id, name, owner, project, allocation, state, queue, nodes, ppn, walltime, priority, cores, score (default: score)")),
+         (("--reverse",), dict(action="store_true", help="Sort in ascending order (default is descending for score, ascending for others)")),
+         (("-n", "--limit"), dict(type=int, help="Show only the top N jobs by sort order")),
+         _COLLECT_ARG,
+         (("-d", "--detailed"), dict(action="store_true", help="Show detailed information for specific jobs")),
+         (("--history",), dict(action="store_true", help="Include job history from database (for detailed view)")),
+         (("--format",), dict(choices=["table", "detailed", "json"], default="table", help="Output format for job details (default: table)")),
+         (("--show-raw",), dict(action="store_true", help="Show raw PBS attributes (for detailed view)")),
+      ]
+   },
+   "nodes": {
+      "args": [
+         (("-s", "--state"), dict(choices=_NODE_STATE_CHOICES, help="Filter by node state")),
+         _REFRESH_ARG,
+         _COLUMNS_ARG,
+         (("-d", "--detailed"), dict(action="store_true", help="Show detailed table format instead of summary")),
+         _COLLECT_ARG,
+      ]
+   },
+   "queues": {
+      "args": [
+         _REFRESH_ARG,
+         _COLUMNS_ARG,
+         _COLLECT_ARG,
+      ]
+   },
+   "history": {
+      "args": [
+         (("-u", "--user"), dict(help="Filter by username")),
+         (("-p", "--project"), dict(help="Filter by project name (partial string matching, case-sensitive)")),
+         (("-d", "--days"), dict(type=int, default=30, help="Number of days to look back (default: 30)")),
+         (("-s", "--state"), dict(choices=_HISTORY_STATE_CHOICES, default="all", help="Filter by completion state: C (completed), F (finished), E (exiting), all (default: all)")),
+         (("--columns",), dict(help="Comma-separated list of columns to display: job_id, name, owner, project, allocation, state, queue, nodes, walltime, submit_time, start_time, end_time, queued, runtime, exit_status, cores")),
+         (("--sort",), dict(default="submit_time", help="Column to sort by: job_id, name, owner, project, allocation, state, queue, nodes, walltime, submit_time, start_time, end_time, queued, runtime (default: submit_time)")),
+         (("--reverse",), dict(action="store_true", help="Sort in reverse order")),
+         (("--limit",), dict(type=int, default=100, help="Maximum number of jobs to show (default: 100)")),
+         (("--include-pbs-history",), dict(action="store_true", help="Also include recent completed jobs from qstat -x")),
+      ]
+   },
+   "config": {
+      "args": [
+         (("--create",), dict(action="store_true", help="Create sample configuration file")),
+         (("--show",), dict(action="store_true", help="Show current configuration")),
+      ]
+   },
+}
+
+
+def _build_subparser(subparsers, name: str) -> argparse.ArgumentParser:
+   """Add a subcommand parser from its entry in _SUBCOMMAND_SPECS"""
+   spec = _SUBCOMMAND_SPECS[name]
+   subparser = subparsers.add_parser(name, help=_COMMAND_HELP[name])
+   for flags, kwargs in spec["args"]:
+      subparser.add_argument(*flags, **kwargs)
+   return subparser
+
+
+def _build_resv_parser(subparsers) -> None:
+   """Add the reservations command parser"""
    
-   # Reservations command
    reservations_parser = subparsers.add_parser(
       "resv",
-      help="Reservation information and management",
-      aliases=["reservations", "reserv"]
+      help=_COMMAND_HELP["resv"],
+      aliases=_COMMAND_ALIASES["resv"]
    )
    
    # Reservation subcommands
@@ -278,360 +292,26 @@ Examples:
    show_parser.add_argument("reservation_ids", nargs="*", help="Reservation IDs to show")
    show_parser.add_argument("--format", choices=["table", "json", "yaml"], default="table", help="Output format")
    show_parser.add_argument("--show-nodes", action="store_true", help="Show all reserved nodes (not truncated)")
+
+
+def _build_analyze_parser(subparsers) -> None:
+   """Add the analyze command parser"""
    
-   # History command
-   history_parser = subparsers.add_parser(
-      "history",
-      help="Show historical job information from database"
-   )
-   history_parser.add_argument(
-      "-u", "--user",
-      help="Filter by username"
-   )
-   history_parser.add_argument(
-      "-p", "--project",
-      help="Filter by project name (partial string matching, case-sensitive)"
-   )
-   history_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to look back (default: 30)"
-   )
-   history_parser.add_argument(
-      "-s", "--state",
-      choices=["C", "F", "E", "all"],
-      default="all",
-      help="Filter by completion state: C (completed), F (finished), E (exiting), all (default: all)"
-   )
-   history_parser.add_argument(
-      "--columns",
-      help="Comma-separated list of columns to display: job_id, name, owner, project, allocation, state, queue, nodes, walltime, submit_time, start_time, end_time, queued, runtime, exit_status, cores"
-   )
-   history_parser.add_argument(
-      "--sort",
-      default="submit_time",
-      help="Column to sort by: job_id, name, owner, project, allocation, state, queue, nodes, walltime, submit_time, start_time, end_time, queued, runtime (default: submit_time)"
-   )
-   history_parser.add_argument(
-      "--reverse",
-      action="store_true",
-      help="Sort in reverse order"
-   )
-   history_parser.add_argument(
-      "--limit",
-      type=int,
-      default=100,
-      help="Maximum number of jobs to show (default: 100)"
-   )
-   history_parser.add_argument(
-      "--include-pbs-history",
-      action="store_true",
-      help="Also include recent completed jobs from qstat -x"
-   )
-   
-   # Analyze command
    analyze_parser = subparsers.add_parser(
       "analyze",
-      help="Analytics and analysis commands"
-   )
-   analyze_subparsers = analyze_parser.add_subparsers(
-      dest="analyze_action",
-      help="Analysis actions"
-   )
-   
-   # Analyze run-now
-   run_now_parser = analyze_subparsers.add_parser(
-      "run-now",
-      help="Suggest a job shape you can run right now safely"
-   )
-   run_now_parser.add_argument(
-      "-b", "--buffer-minutes",
-      type=int,
-      default=8,
-      help="Safety buffer before contention in minutes (default: 8)"
-   )
-   run_now_parser.add_argument(
-      "--format",
-      choices=["table", "json"],
-      default="table",
-      help="Output format (default: table)"
-   )
-   run_now_parser.add_argument(
-      "-r", "--refresh",
-      action="store_true",
-      help="Force refresh of data"
+      help=_COMMAND_HELP["analyze"]
    )
    
-   # Analyze run-score
-   run_score_parser = analyze_subparsers.add_parser(
-      "run-score",
-      help="Analyze job scores at queue → run transitions"
-   )
-   run_score_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to analyze (default: 30)"
-   )
-   run_score_parser.add_argument(
-      "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Output format (default: table)"
-   )
-   
-   # Analyze walltime-efficiency-by-user
-   walltime_user_parser = analyze_subparsers.add_parser(
-      "walltime-efficiency-by-user",
-      help="Analyze walltime efficiency by user"
-   )
-   walltime_user_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to analyze (default: 30)"
-   )
-   walltime_user_parser.add_argument(
-      "-u", "--user",
-      help="Filter to specific user (partial match, case-sensitive)"
-   )
-   walltime_user_parser.add_argument(
-      "--min-jobs",
-      type=int,
-      default=3,
-      help="Minimum number of jobs required for main table inclusion (default: 3)"
-   )
-   walltime_user_parser.add_argument(
-      "-q", "--queue",
-      help="Filter by queue name (partial match, case-sensitive)"
-   )
-   walltime_user_parser.add_argument(
-      "--min-nodes",
-      type=int,
-      help="Minimum number of nodes required for job inclusion"
-   )
-   walltime_user_parser.add_argument(
-      "--max-nodes",
-      type=int,
-      help="Maximum number of nodes allowed for job inclusion"
-   )
-   walltime_user_parser.add_argument(
-      "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Output format (default: table)"
-   )
-   
-   # Analyze walltime-efficiency-by-project
-   walltime_project_parser = analyze_subparsers.add_parser(
-      "walltime-efficiency-by-project",
-      help="Analyze walltime efficiency by project"
-   )
-   walltime_project_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to analyze (default: 30)"
-   )
-   walltime_project_parser.add_argument(
-      "-p", "--project",
-      help="Filter to specific project (partial match, case-sensitive)"
-   )
-   walltime_project_parser.add_argument(
-      "--min-jobs",
-      type=int,
-      default=3,
-      help="Minimum number of jobs required for main table inclusion (default: 3)"
-   )
-   walltime_project_parser.add_argument(
-      "-q", "--queue",
-      help="Filter by queue name (partial match, case-sensitive)"
-   )
-   walltime_project_parser.add_argument(
-      "--min-nodes",
-      type=int,
-      help="Minimum number of nodes required for job inclusion"
-   )
-   walltime_project_parser.add_argument(
-      "--max-nodes",
-      type=int,
-      help="Maximum number of nodes allowed for job inclusion"
-   )
-   walltime_project_parser.add_argument(
-      "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Output format (default: table)"
-   )
-   
-   # Analyze reservation-utilization
-   reservation_util_parser = analyze_subparsers.add_parser(
-      "reservation-utilization",
-      help="Analyze reservation utilization efficiency"
-   )
-   reservation_util_parser.add_argument(
-      "reservation_ids",
-      nargs="*",
-      help="Specific reservation IDs to analyze (if not provided, analyzes all)"
-   )
-   reservation_util_parser.add_argument(
-      "--start-date",
-      type=str,
-      help="Start date for analysis period (YYYY-MM-DD format)"
-   )
-   reservation_util_parser.add_argument(
-      "--end-date",
-      type=str,
-      help="End date for analysis period (YYYY-MM-DD format)"
-   )
-   reservation_util_parser.add_argument(
-      "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Output format (default: table)"
-   )
-   
-   # Analyze reservation-trends
-   reservation_trends_parser = analyze_subparsers.add_parser(
-      "reservation-trends",
-      help="Analyze reservation utilization trends over time"
-   )
-   reservation_trends_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to analyze (default: 30)"
-   )
-   reservation_trends_parser.add_argument(
-      "-o", "--owner",
-      help="Filter by reservation owner"
-   )
-   reservation_trends_parser.add_argument(
-      "-q", "--queue",
-      help="Filter by queue name"
-   )
-   reservation_trends_parser.add_argument(
-      "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Output format (default: table)"
-   )
-   
-   # Analyze reservation-owner-ranking
-   reservation_ranking_parser = analyze_subparsers.add_parser(
-      "reservation-owner-ranking",
-      help="Rank reservation owners by utilization efficiency"
-   )
-   reservation_ranking_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to analyze (default: 30)"
-   )
-   reservation_ranking_parser.add_argument(
-      "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Output format (default: table)"
-   )
+   from . import _analyze_parser
+   _analyze_parser.build(analyze_parser)
 
-   # Analyze usage-insights (Milestone 1)
-   usage_insights_parser = analyze_subparsers.add_parser(
-      "usage-insights",
-      help="Usage insights derived metrics and initial plots"
-   )
-   usage_insights_parser.add_argument(
-      "-d", "--days",
-      type=int,
-      default=30,
-      help="Number of days to analyze (default: 30)"
-   )
-   usage_insights_parser.add_argument(
-       "-m", "--min-queue-node-hours",
-      type=float,
-      default=100.0,
-      help="Minimum requested node-hours per queue to include (default: 100)"
-   )
-   usage_insights_parser.add_argument(
-       "-n", "--top-n-queues",
-      type=int,
-      help="Limit to top-N queues by requested node-hours"
-   )
-   usage_insights_parser.add_argument(
-       "-R", "--incl-resv",
-       action="store_true",
-       help="Include reservation queues (names like M12345/R12345/S12345) in analysis"
-    )
-   usage_insights_parser.add_argument(
-       "-a", "--allowlist-queues",
-      nargs='+',
-      help="Queues to always include regardless of thresholds"
-   )
-   usage_insights_parser.add_argument(
-       "-x", "--ignore-queues",
-      nargs='+',
-      help="Queues to exclude from analysis and plots"
-   )
-   usage_insights_parser.add_argument(
-       "-o", "--output-dir",
-      help="Directory to save plots"
-   )
-   usage_insights_parser.add_argument(
-       "-P", "--no-plots",
-      action="store_true",
-      help="Do not generate plots; only compute metrics"
-   )
-   usage_insights_parser.add_argument(
-       "-f", "--format",
-      choices=["table", "csv"],
-      default="table",
-      help="Metrics output format (default: table)"
-   )
-   usage_insights_parser.add_argument(
-       "-t", "--ts-freq",
-      choices=["H", "D", "W"],
-      default="D",
-      help="Time-series frequency for advanced plots: H (hourly), D (daily), W (weekly)"
-   )
-   usage_insights_parser.add_argument(
-       "-U", "--per-user-top-n",
-      type=int,
-      default=20,
-      help="Top N users by job count to include in per-user plots (advanced suite)"
-   )
-   usage_insights_parser.add_argument(
-       "-j", "--per-user-min-jobs",
-      type=int,
-      default=3,
-      help="Minimum jobs per user to be included in per-user plots (advanced suite)"
-   )
-   usage_insights_parser.add_argument(
-      "--total-cluster-nodes",
-      type=int,
-      help=argparse.SUPPRESS
-   )
-   
-   # Config command
-   config_parser = subparsers.add_parser(
-      "config",
-      help="Configuration management"
-   )
-   config_parser.add_argument(
-      "--create",
-      action="store_true",
-      help="Create sample configuration file"
-   )
-   config_parser.add_argument(
-      "--show",
-      action="store_true",
-      help="Show current configuration"
-   )
+
+def _build_database_parser(subparsers) -> None:
+   """Add the database command parser"""
    
-   # Database command
    database_parser = subparsers.add_parser(
       "database",
-      help="Database management"
+      help=_COMMAND_HELP["database"]
    )
    database_subparsers = database_parser.add_subparsers(
       dest="database_action",
@@ -747,11 +427,14 @@ Examples:
       default="table",
       help="Output format (default: table)"
    )
+
+
+def _build_daemon_parser(subparsers) -> None:
+   """Add the daemon command parser"""
    
-   # Daemon command
    daemon_parser = subparsers.add_parser(
       "daemon",
-      help="Background data collection daemon management"
+      help=_COMMAND_HELP["daemon"]
    )
    daemon_subparsers = daemon_parser.add_subparsers(
       dest="daemon_action",
@@ -788,12 +471,85 @@ Examples:
       "status",
       help="Show daemon status and recent collection activity"
    )
+
+
+# Command name -> subparser builder (aliases share a builder)
+_SUBPARSER_BUILDERS = {
+   "status": functools.partial(_build_subparser, name="status"),
+   "jobs": functools.partial(_build_subparser, name="jobs"),
+   "nodes": functools.partial(_build_subparser, name="nodes"),
+   "queues": functools.partial(_build_subparser, name="queues"),
+   "resv": _build_resv_parser,
+   "reservations": _build_resv_parser,
+   "reserv": _build_resv_parser,
+   "history": functools.partial(_build_subparser, name="history"),
+   "analyze": _build_analyze_parser,
+   "config": functools.partial(_build_subparser, name="config"),
+   "database": _build_database_parser,
+   "daemon": _build_daemon_parser,
+}
+
+# Global options that consume the following token as their value
+_GLOBAL_VALUE_OPTIONS = ("-c", "--config", "--log-file", "--max-width")
+
+
+def _sniff_command(argv: List[str]) -> Optional[str]:
+   """
+   Find the subcommand in argv without building the full parser
    
-   return parser
+   Args:
+      argv: Command line arguments (without program name)
+      
+   Returns:
+      Command name, or None if help was requested or no known command was found
+   """
+   
+   skip_next = False
+   for token in argv:
+      if skip_next:
+         skip_next = False
+      elif token in ("-h", "--help"):
+         return None
+      elif token.startswith("-"):
+         # Options may be abbreviated (--conf), so match value options by prefix
+         if "=" not in token and (token == "-c" or (token.startswith("--") and
+               any(opt.startswith(token) for opt in _GLOBAL_VALUE_OPTIONS[1:]))):
+            skip_next = True
+      else:
+         return token if token in _SUBPARSER_BUILDERS else None
+   return None
+
+
+# Command name -> (module, class); modules are imported on first dispatch
+_COMMAND_SPECS = {
+   "status": (".commands", "StatusCommand"),
+   "jobs": (".commands", "JobsCommand"),
+   "nodes": (".commands", "NodesCommand"),
+   "queues": (".commands", "QueuesCommand"),
+   "history": (".commands", "HistoryCommand"),
+   "resv": (".commands", "ReservationsCommand"),
+   "reservations": (".commands", "ReservationsCommand"),
+   "reserv": (".commands", "ReservationsCommand"),
+   "analyze": (".analyze_commands", "AnalyzeCommand"),
+   "database": (".commands", "DatabaseCommand"),
+   "daemon": (".commands", "DaemonCommand"),
+}
 
+# Commands that run without a DataCollector
+_NO_COLLECTOR_COMMANDS = frozenset({"database", "daemon"})
 
-def setup_logging_from_args(args: argparse.Namespace, config: Config) -> None:
+
+@functools.lru_cache(maxsize=None)
+def _get_command_cls(name: str) -> type:
+   """Import and return the command class registered for a command name"""
+   module_name, class_name = _COMMAND_SPECS[name]
+   return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
+def setup_logging_from_args(args: argparse.Namespace, config: "Config") -> None:
    """Setup logging based on command line arguments and configuration"""
+   import logging
+   from ..utils.logging_setup import setup_logging
    
    # Determine log level
    if args.verbose:
@@ -816,24 +572,30 @@ def setup_logging_from_args(args: argparse.Namespace, config: Config) -> None:
    )
 
 
-def apply_cli_overrides(args: argparse.Namespace, config: Config) -> None:
+def _log_error(message: str) -> None:
+   """Log an error from main() (logging is only imported on this failure path)"""
+   import logging
+   logging.getLogger(__name__).error(message)
+
+
+def apply_cli_overrides(args: argparse.Namespace, config: "Config") -> None:
    """Apply command-line overrides to configuration"""
    
-   # Apply table width overrides
-   if hasattr(args, 'max_width') and args.max_width:
+   # Apply table width overrides (global options, always present on args)
+   if args.max_width:
       config.display.max_table_width = args.max_width
    
-   if hasattr(args, 'auto_width') and args.auto_width:
+   if args.auto_width:
       config.display.auto_width = True
    
-   if hasattr(args, 'no_expand') and args.no_expand:
+   if args.no_expand:
       config.display.expand_columns = False
    
-   if hasattr(args, 'wrap') and args.wrap:
+   if args.wrap:
       config.display.word_wrap = True
 
 
-def handle_config_command(args: argparse.Namespace, config: Config) -> int:
+def handle_config_command(args: argparse.Namespace, config: "Config") -> int:
    """Handle configuration management commands"""
    
    if args.create:
@@ -842,16 +604,18 @@ def handle_config_command(args: argparse.Namespace, config: Config) -> int:
       return 0
    
    if args.show:
-      print(f"Configuration file: {config.config_file}")
-      print(f"PBS command timeout: {config.pbs.command_timeout}s")
-      print(f"Job refresh interval: {config.pbs.job_refresh_interval}s")
-      print(f"Node refresh interval: {config.pbs.node_refresh_interval}s")
-      print(f"Queue refresh interval: {config.pbs.queue_refresh_interval}s")
-      print(f"Log level: {config.logging.level}")
-      print(f"Use colors: {config.display.use_colors}")
-      print(f"Max table width: {config.display.max_table_width}")
-      print(f"Auto width: {config.display.auto_width}")
-      print(f"Expand columns: {config.display.expand_columns}")
+      sys.stdout.write(
+         f"Configuration file: {config.config_file}\n"
+         f"PBS command timeout: {config.pbs.command_timeout}s\n"
+         f"Job refresh interval: {config.pbs.job_refresh_interval}s\n"
+         f"Node refresh interval: {config.pbs.node_refresh_interval}s\n"
+         f"Queue refresh interval: {config.pbs.queue_refresh_interval}s\n"
+         f"Log level: {config.logging.level}\n"
+         f"Use colors: {config.display.use_colors}\n"
+         f"Max table width: {config.display.max_table_width}\n"
+         f"Auto width: {config.display.auto_width}\n"
+         f"Expand columns: {config.display.expand_columns}\n"
+      )
       return 0
    
    print("Use --create to create sample configuration or --show to display current settings")
@@ -870,12 +634,22 @@ def main(argv: Optional[List[str]] = None) -> int:
    """
    
    # Parse arguments
-   parser = create_parser()
+   if argv is None:
+      argv = sys.argv[1:]
+   # Top-level help/version (or no arguments) only needs the command list
+   stubs_only = not argv or argv[0] in ("-h", "--help", "--version")
+   parser = create_parser(_sniff_command(argv), stubs_only=stubs_only)
    args = parser.parse_args(argv)
    
-   # Load configuration
+   # Handle no command before touching the configuration
+   if not args.command:
+      parser.print_help()
+      return 1
+   
+   # Load configuration (config --create only writes a sample file, so skip reading one)
    try:
-      config = Config(config_file=args.config)
+      from ..config import Config
+      config = Config(config_file=args.config, load=not (args.command == "config" and args.create))
    except Exception as e:
       print(f"Error loading configuration: {str(e)}", file=sys.stderr)
       return 1
@@ -883,31 +657,22 @@ def main(argv: Optional[List[str]] = None) -> int:
    # Apply command-line overrides to config
    apply_cli_overrides(args, config)
    
-   # Setup logging
-   setup_logging_from_args(args, config)
-   logger = logging.getLogger(__name__)
-   
-   # Handle no command
-   if not args.command:
-      parser.print_help()
-      return 1
+   # Setup logging (config management only needs it when explicitly requested)
+   if args.command != "config" or args.verbose or args.log_file:
+      setup_logging_from_args(args, config)
    
    # Handle config command
    if args.command == "config":
       return handle_config_command(args, config)
    
-   # Handle database command (doesn't need PBS connection)
-   if args.command == "database":
-      cmd = DatabaseCommand(None, config)  # No need for collector
-      return cmd.execute(args)
-   
-   # Handle daemon command (doesn't need PBS connection)
-   if args.command == "daemon":
-      cmd = DaemonCommand(None, config)  # No need for collector
+   # Handle database and daemon commands (don't need PBS connection)
+   if args.command in _NO_COLLECTOR_COMMANDS:
+      cmd = _get_command_cls(args.command)(None, config)
       return cmd.execute(args)
    
    # Initialize data collector for other commands
    try:
+      from ..data_collector import DataCollector
       collector = DataCollector(config, use_sample_data=args.use_sample_data)
       
       # Test PBS connection (skip if using sample data)
@@ -917,50 +682,25 @@ def main(argv: Optional[List[str]] = None) -> int:
          return 1
       
    except Exception as e:
-      logger.error(f"Failed to initialize data collector: {str(e)}")
+      _log_error(f"Failed to initialize data collector: {str(e)}")
       print(f"Error: {str(e)}", file=sys.stderr)
       return 1
    
    # Execute command
    try:
-      if args.command == "status":
-         cmd = StatusCommand(collector, config)
-         return cmd.execute(args)
-      
-      elif args.command == "jobs":
-         cmd = JobsCommand(collector, config)
-         return cmd.execute(args)
-      
-      elif args.command == "nodes":
-         cmd = NodesCommand(collector, config)
-         return cmd.execute(args)
-      
-      elif args.command == "queues":
-         cmd = QueuesCommand(collector, config)
-         return cmd.execute(args)
-      
-      elif args.command == "history":
-         cmd = HistoryCommand(collector, config)
-         return cmd.execute(args)
-      
-      elif args.command == "analyze":
-         cmd = AnalyzeCommand(collector, config)
-         return cmd.execute(args)
-      
-      elif args.command in ["resv", "reservations", "reserv"]:
-         cmd = ReservationsCommand(collector, config)
-         return cmd.execute(args)
-      
-      else:
+      if args.command not in _COMMAND_SPECS:
          print(f"Unknown command: {args.command}", file=sys.stderr)
          return 1
+      
+      cmd = _get_command_cls(args.command)(collector, config)
+      return cmd.execute(args)
    
    except KeyboardInterrupt:
       print("\nInterrupted by user", file=sys.stderr)
       return 130
    
    except Exception as e:
-      logger.error(f"Command execution failed: {str(e)}")
+      _log_error(f"Command execution failed: {str(e)}")
       print(f"Error: {str(e)}", file=sys.stderr)
       return 1
 
@@ -2,15 +2,26 @@
 Configuration management for PBS Monitor
 """
 
+import copy
 import os
+import sys
 import yaml
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
+# Use the LibYAML C loader/dumper when PyYAML was built with it
+try:
+   from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+   from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PBSConfig:
    """PBS system configuration"""
    
@@ -35,7 +46,7 @@ class PBSConfig:
    server_refresh_interval: int = 3600  # 1 hour - server info changes infrequently
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DisplayConfig:
    """Display and output configuration"""
    
@@ -71,7 +82,7 @@ class DisplayConfig:
    ])
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DatabaseConfig:
    """Database configuration"""
    
@@ -100,7 +111,7 @@ class DatabaseConfig:
    batch_size: int = 1000
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LoggingConfig:
    """Logging configuration"""
    
@@ -117,15 +128,64 @@ class LoggingConfig:
    date_format: str = "%d-%m %H:%M"
 
 
+# Log level names accepted in the logging section
+_LOG_LEVELS = {
+   'DEBUG': logging.DEBUG,
+   'INFO': logging.INFO,
+   'WARNING': logging.WARNING,
+   'ERROR': logging.ERROR,
+   'CRITICAL': logging.CRITICAL
+}
+
+# Field names per configuration section, used when saving
+_CONFIG_FIELDS = {
+   cls: tuple(f.name for f in fields(cls))
+   for cls in (PBSConfig, DisplayConfig, DatabaseConfig, LoggingConfig)
+}
+_CONFIG_FIELD_SETS = {cls: frozenset(names) for cls, names in _CONFIG_FIELDS.items()}
+
+# Parsed config files by path, reused while the file's (mtime, size) is unchanged
+_PARSED_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _default_config_path() -> str:
+   """
+   Find the default configuration file
+   
+   Not cached: the search depends on HOME and the working directory, which
+   may change between Config instances in one process.
+   
+   Returns:
+      First existing config file, or ~/.pbs_monitor.yaml if none exist
+   """
+   home = os.path.expanduser("~")
+   
+   # Try these locations in order
+   config_paths = [
+      os.path.join(home, ".pbs_monitor.yaml"),
+      os.path.join(home, ".config", "pbs_monitor", "config.yaml"),
+      "/etc/pbs_monitor/config.yaml",
+      "pbs_monitor.yaml"
+   ]
+   
+   for path in config_paths:
+      if os.path.exists(path):
+         return path
+   
+   # Return first path as default
+   return config_paths[0]
+
+
 class Config:
    """Main configuration manager"""
    
-   def __init__(self, config_file: Optional[str] = None):
+   def __init__(self, config_file: Optional[str] = None, load: bool = True):
       """
       Initialize configuration
       
       Args:
          config_file: Path to configuration file
+         load: Read settings from config_file (False keeps the defaults)
       """
       self.config_file = config_file or self._get_default_config_path()
       self.logger = logging.getLogger(__name__)
@@ -137,38 +197,37 @@ class Config:
       self.database = DatabaseConfig()
       
       # Load configuration from file
-      self._load_config()
+      if load:
+         self._load_config()
    
    def _get_default_config_path(self) -> str:
       """Get default configuration file path"""
-      # Try these locations in order
-      config_paths = [
-         os.path.expanduser("~/.pbs_monitor.yaml"),
-         os.path.expanduser("~/.config/pbs_monitor/config.yaml"),
-         "/etc/pbs_monitor/config.yaml",
-         "pbs_monitor.yaml"
-      ]
-      
-      for path in config_paths:
-         if os.path.exists(path):
-            return path
-      
-      # Return first path as default
-      return config_paths[0]
+      return _default_config_path()
    
    def _load_config(self) -> None:
       """Load configuration from file"""
-      if not os.path.exists(self.config_file):
+      try:
+         stat = os.stat(self.config_file)
+      except OSError:
+         # Any unusable path (missing, permission denied, bad parent) means no config file
          self.logger.debug(f"Configuration file not found: {self.config_file}")
          return
       
       try:
-         with open(self.config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+         file_key = (stat.st_mtime_ns, stat.st_size)
+         cached = _PARSED_CONFIG_CACHE.get(self.config_file)
+         if cached is None or cached[0] != file_key:
+            # Read the whole file as bytes and let YAML detect the encoding
+            with open(self.config_file, 'rb') as f:
+               cached = (file_key, yaml.load(f.read(), Loader=_SafeLoader))
+            _PARSED_CONFIG_CACHE[self.config_file] = cached
          
-         if not config_data:
+         if not cached[1]:
             return
          
+         # Apply a copy so config values never alias the cached data
+         config_data = copy.deepcopy(cached[1])
+         
          # Update PBS configuration
          if 'pbs' in config_data:
             self._update_config_object(self.pbs, config_data['pbs'])
@@ -192,8 +251,9 @@ class Config:
    
    def _update_config_object(self, config_obj: Any, config_data: Dict[str, Any]) -> None:
       """Update configuration object with data from file"""
+      valid_fields = _CONFIG_FIELD_SETS[type(config_obj)]
       for key, value in config_data.items():
-         if hasattr(config_obj, key):
+         if key in valid_fields:
             setattr(config_obj, key, value)
    
    def save_config(self) -> None:
@@ -212,7 +272,8 @@ class Config:
          }
          
          with open(self.config_file, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            yaml.dump(config_data, f, Dumper=_SafeDumper, default_flow_style=False, indent=2,
+                      sort_keys=False)
          
          self.logger.info(f"Configuration saved to {self.config_file}")
          
@@ -221,9 +282,7 @@ class Config:
    
    def _config_to_dict(self, config_obj: Any) -> Dict[str, Any]:
       """Convert configuration object to dictionary"""
-      if hasattr(config_obj, '__dict__'):
-         return {k: v for k, v in config_obj.__dict__.items() if not k.startswith('_')}
-      return {}
+      return {name: getattr(config_obj, name) for name in _CONFIG_FIELDS[type(config_obj)]}
    
    def create_sample_config(self) -> None:
       """Create a sample configuration file"""
@@ -287,7 +346,8 @@ class Config:
             os.makedirs(config_dir, exist_ok=True)
          
          with open(self.config_file, 'w') as f:
-            yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+            yaml.dump(sample_config, f, Dumper=_SafeDumper, default_flow_style=False, indent=2,
+                      sort_keys=False)
          
          print(f"Sample configuration created at {self.config_file}")
          
@@ -296,15 +356,7 @@ class Config:
    
    def get_log_level(self) -> int:
       """Get numeric log level"""
-      level_map = {
-         'DEBUG': logging.DEBUG,
-         'INFO': logging.INFO,
-         'WARNING': logging.WARNING,
-         'ERROR': logging.ERROR,
-         'CRITICAL': logging.CRITICAL
-      }
-      
-      return level_map.get(self.logging.level.upper(), logging.INFO)
+      return _LOG_LEVELS.get(self.logging.level.upper(), logging.INFO)
    
    def __str__(self) -> str:
       return f"Config(file={self.config_file})" 
\ No newline at end of file
@@ -2,11 +2,15 @@
 Data Collector for PBS Monitor - Orchestrates data gathering from PBS system
 """
 
+import copy
+import functools
+import importlib.util
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple, Any
 from datetime import datetime, timedelta
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .pbs_commands import PBSCommands, PBSCommandError
 from .models.job import PBSJob, JobState
@@ -16,17 +20,48 @@ from .models.reservation import PBSReservation, ReservationState
 from .config import Config
 from .utils.logging_setup import create_pbs_logger
 
-# Database integration (optional)
-try:
-   from .database import (
-      RepositoryFactory, ModelConverters, DataCollectionStatus,
-      DatabaseManager, initialize_database
-   )
-   DATABASE_AVAILABLE = True
-except ImportError:
-   DATABASE_AVAILABLE = False
+# Database integration (optional). Importing SQLAlchemy is slow, so the
+# database layer is only imported the first time a collector uses it.
+DATABASE_AVAILABLE = importlib.util.find_spec("sqlalchemy") is not None
 
-from .database.repositories import RepositoryFactory, JobStateInfo, ReservationStateInfo
+if TYPE_CHECKING:
+   from .database import ModelConverters
+   from .database.connection import DatabaseManager
+   from .database.repositories import RepositoryFactory, JobStateInfo, ReservationStateInfo
+
+# Monotonic timestamp for data that has never been refreshed, so that
+# any interval check against it is immediately due
+_NEVER = float('-inf')
+
+# Shortest sleep between background loop passes, so a zero or negative
+# refresh interval cannot make the thread spin
+_MIN_BACKGROUND_WAIT = 1.0
+
+
+def _exclusive_refresh(name: str):
+   """
+   Decorate a DataCollector._refresh_* method so only one thread runs it
+   
+   A caller that finds a refresh of the same data already in flight waits
+   for it to publish its result instead of starting a second PBS command,
+   so concurrent callers share one subprocess. Readers never take these
+   locks; refreshes publish by attribute assignment.
+   """
+   def decorator(method):
+      @functools.wraps(method)
+      def wrapper(self) -> None:
+         lock = self._refresh_locks[name]
+         if not lock.acquire(blocking=False):
+            self.logger.debug(f"Waiting for in-flight {name} refresh")
+            if lock.acquire(timeout=self.config.pbs.command_timeout):
+               lock.release()
+            return
+         try:
+            method(self)
+         finally:
+            lock.release()
+      return wrapper
+   return decorator
 
 
 class DataCollector:
@@ -50,41 +85,66 @@ class DataCollector:
       self.pbs_commands = PBSCommands(timeout=self.config.pbs.command_timeout, 
                                      use_sample_data=use_sample_data)
       
-      # Data storage
-      self._jobs: List[PBSJob] = []
-      self._queues: List[PBSQueue] = []
-      self._nodes: List[PBSNode] = []
-      self._reservations: List[PBSReservation] = []
+      # Data storage. Each refresh swaps in a new immutable snapshot, so the
+      # getters can hand these out without copying.
+      self._jobs: Tuple[PBSJob, ...] = ()
+      self._queues: Tuple[PBSQueue, ...] = ()
+      self._nodes: Tuple[PBSNode, ...] = ()
+      self._reservations: Tuple[PBSReservation, ...] = ()
+      self._jobs_by_owner: Dict[str, Tuple[PBSJob, ...]] = {}
+      self._summary_cache: Optional[Tuple[Tuple[Sequence, ...], Dict[str, Any]]] = None
       self._server_data: Optional[Dict[str, Any]] = None
+      self._server_defaults: Optional[Dict[str, Any]] = None
       
-      # Last update timestamps
-      self._last_job_update: Optional[datetime] = None
-      self._last_queue_update: Optional[datetime] = None
-      self._last_node_update: Optional[datetime] = None
-      self._last_reservation_update: Optional[datetime] = None
-      self._last_server_update: Optional[datetime] = None
-      self._last_auto_persist: Optional[datetime] = None
+      # Last update timestamps (time.monotonic()), used only for refresh
+      # interval checks so they are unaffected by wall clock changes
+      self._last_job_update = _NEVER
+      self._last_queue_update = _NEVER
+      self._last_node_update = _NEVER
+      self._last_reservation_update = _NEVER
+      self._last_server_update = _NEVER
+      self._last_auto_persist = _NEVER
       
       # Job state tracking for history
-      self._job_state_cache: Dict[str, JobStateInfo] = {}
+      self._job_state_cache: Dict[str, 'JobStateInfo'] = {}
       self._reservation_state_cache: Dict[str, 'ReservationStateInfo'] = {}
       
       # Threading support
       self._update_lock = threading.Lock()
+      self._refresh_locks = {
+         name: threading.Lock()
+         for name in ('jobs', 'queues', 'nodes', 'reservations', 'server')
+      }
       self._background_update_thread: Optional[threading.Thread] = None
-      self._stop_background_updates = False
-      
-      # Database integration
-      if self._database_enabled:
-         self._repository_factory = RepositoryFactory(config)
-         self._model_converters = ModelConverters()
-      else:
-         self._repository_factory = None
-         self._model_converters = None
+      self._stop_background_updates = threading.Event()
       
       # Logging
       self.logger = logging.getLogger(__name__)
    
+   @functools.cached_property
+   def _db_manager(self) -> Optional['DatabaseManager']:
+      """Database manager, created on first use when the database is enabled"""
+      if not self._database_enabled:
+         return None
+      from .database.connection import DatabaseManager
+      return DatabaseManager(self.config)
+   
+   @functools.cached_property
+   def _repository_factory(self) -> Optional['RepositoryFactory']:
+      """Repository factory, created on first use when the database is enabled"""
+      if not self._database_enabled:
+         return None
+      from .database.repositories import RepositoryFactory
+      return RepositoryFactory(self.config, self._db_manager)
+   
+   @functools.cached_property
+   def _model_converters(self) -> Optional['ModelConverters']:
+      """Model converters, created on first use when the database is enabled"""
+      if not self._database_enabled:
+         return None
+      from .database import ModelConverters
+      return ModelConverters()
+   
    def test_connection(self) -> bool:
       """
       Test connection to PBS system
@@ -109,8 +169,7 @@ class DataCollector:
          return False
       
       try:
-         db_manager = DatabaseManager(self.config)
-         return db_manager.test_connection()
+         return self._db_manager.test_connection()
       except Exception as e:
          self.logger.error(f"Failed to test database connection: {str(e)}")
          return False
@@ -119,7 +178,7 @@ class DataCollector:
                 user: Optional[str] = None,
                 project: Optional[str] = None,
                 force_refresh: bool = False,
-                include_historical: bool = False) -> List[PBSJob]:
+                include_historical: bool = False) -> Sequence[PBSJob]:
       """
       Get job information
       
@@ -130,40 +189,37 @@ class DataCollector:
          include_historical: Include historical jobs from database
          
       Returns:
-         List of PBSJob objects
+         Sequence of PBSJob objects
       """
       should_refresh = (
          force_refresh or 
-         self._last_job_update is None or
-         (datetime.now() - self._last_job_update).total_seconds() > 
+         time.monotonic() - self._last_job_update > 
          self.config.pbs.job_refresh_interval
       )
       
       if should_refresh:
          self._refresh_jobs()
       
-      # Start with current PBS jobs
-      jobs = self._jobs.copy()
+      # Start with current PBS jobs, using the per-owner index to filter by user
+      jobs = self._jobs_by_owner.get(user, ()) if user else self._jobs
       
       # Add historical jobs if requested and database is available
       if include_historical and self._database_enabled:
          try:
             job_repo = self._repository_factory.get_job_repository()
             historical_jobs = job_repo.get_historical_jobs(user=user)
-            historical_pbs_jobs = [
-               self._model_converters.job.from_database(job) for job in historical_jobs
-            ]
             
-            # Merge with current jobs, avoiding duplicates
+            # Merge with current jobs, avoiding duplicates. Rows for jobs that
+            # are still current are skipped before conversion.
             current_job_ids = {job.job_id for job in jobs}
-            jobs.extend([job for job in historical_pbs_jobs if job.job_id not in current_job_ids])
+            jobs = list(jobs)
+            jobs.extend(
+               self._model_converters.job.from_database(job)
+               for job in historical_jobs if job.job_id not in current_job_ids
+            )
          except Exception as e:
             self.logger.warning(f"Failed to retrieve historical jobs: {str(e)}")
       
-      # Filter by user if specified
-      if user:
-         jobs = [job for job in jobs if job.owner == user]
-      
       # Filter by project if specified (using partial string matching)
       if project:
          project_lower = project.lower()
@@ -208,9 +264,10 @@ class DataCollector:
          try:
             job_repo = self._repository_factory.get_job_repository()
             
-            # Get completed jobs from database
-            db_jobs = job_repo.get_historical_jobs(user=user, days=days*2)  # Look back further in DB
-            db_completed_jobs = [job for job in db_jobs if job.is_completed()]
+            # Get completed jobs from database, filtered by state in the query
+            db_completed_jobs = job_repo.get_historical_jobs(
+               user=user, days=days*2, completed_only=True  # Look back further in DB
+            )
             
             # Convert to PBSJob objects and add if not already seen
             for db_job in db_completed_jobs:
@@ -228,7 +285,7 @@ class DataCollector:
       
       return completed_jobs
    
-   def get_queues(self, force_refresh: bool = False) -> List[PBSQueue]:
+   def get_queues(self, force_refresh: bool = False) -> Sequence[PBSQueue]:
       """
       Get queue information
       
@@ -236,21 +293,20 @@ class DataCollector:
          force_refresh: Force refresh from PBS system
          
       Returns:
-         List of PBSQueue objects
+         Sequence of PBSQueue objects
       """
       should_refresh = (
          force_refresh or 
-         self._last_queue_update is None or
-         (datetime.now() - self._last_queue_update).total_seconds() > 
+         time.monotonic() - self._last_queue_update > 
          self.config.pbs.queue_refresh_interval
       )
       
       if should_refresh:
          self._refresh_queues()
       
-      return self._queues.copy()
+      return self._queues
    
-   def get_nodes(self, force_refresh: bool = False) -> List[PBSNode]:
+   def get_nodes(self, force_refresh: bool = False) -> Sequence[PBSNode]:
       """
       Get node information
       
@@ -258,21 +314,20 @@ class DataCollector:
          force_refresh: Force refresh from PBS system
          
       Returns:
-         List of PBSNode objects
+         Sequence of PBSNode objects
       """
       should_refresh = (
          force_refresh or 
-         self._last_node_update is None or
-         (datetime.now() - self._last_node_update).total_seconds() > 
+         time.monotonic() - self._last_node_update > 
          self.config.pbs.node_refresh_interval
       )
       
       if should_refresh:
          self._refresh_nodes()
       
-      return self._nodes.copy()
+      return self._nodes
    
-   def get_reservations(self, force_refresh: bool = False, user: Optional[str] = None) -> List[PBSReservation]:
+   def get_reservations(self, force_refresh: bool = False, user: Optional[str] = None) -> Sequence[PBSReservation]:
       """
       Get reservation information
       
@@ -281,19 +336,18 @@ class DataCollector:
          user: Filter by username (optional)
          
       Returns:
-         List of PBSReservation objects
+         Sequence of PBSReservation objects
       """
       should_refresh = (
          force_refresh or 
-         self._last_reservation_update is None or
-         (datetime.now() - self._last_reservation_update).total_seconds() > 
+         time.monotonic() - self._last_reservation_update > 
          self.config.database.job_collection_interval  # Use job collection interval as default
       )
       
       if should_refresh:
          self._refresh_reservations()
       
-      reservations = self._reservations.copy()
+      reservations = self._reservations
       
       # Filter by user if specified
       if user:
@@ -311,7 +365,22 @@ class DataCollector:
       Returns:
          PBSJob object or None if not found
       """
-      # First try current PBS data
+      # Completed jobs are final in the database, so check it first and
+      # skip the qstat round-trip for them
+      db_job = None
+      db_checked = False
+      if self._database_enabled:
+         try:
+            job_repo = self._repository_factory.get_job_repository()
+            db_job = job_repo.get_job_by_id(job_id)
+            db_checked = True
+            if db_job and db_job.is_completed():
+               return self._model_converters.job.from_database(db_job)
+         except Exception as e:
+            # Not fatal yet: PBS may still have the job
+            self.logger.debug(f"Database lookup for job {job_id} failed, trying PBS: {str(e)}")
+      
+      # Then try current PBS data
       try:
          jobs = self.pbs_commands.qstat_jobs(job_id=job_id)
          if jobs:
@@ -319,11 +388,12 @@ class DataCollector:
       except PBSCommandError as e:
          self.logger.error(f"Failed to get job {job_id} from PBS: {str(e)}")
       
-      # Fall back to database if available
+      # Fall back to database if available, retrying the lookup if it failed above
       if self._database_enabled:
          try:
-            job_repo = self._repository_factory.get_job_repository()
-            db_job = job_repo.get_job_by_id(job_id)
+            if not db_checked:
+               job_repo = self._repository_factory.get_job_repository()
+               db_job = job_repo.get_job_by_id(job_id)
             if db_job:
                return self._model_converters.job.from_database(db_job)
          except Exception as e:
@@ -409,13 +479,34 @@ class DataCollector:
       queues = self.get_queues()
       nodes = self.get_nodes()
       
-      # Job statistics
+      # Each refresh publishes a new snapshot, so reuse the previous statistics
+      # while all three are the same objects
+      snapshots = (jobs, queues, nodes)
+      cached = self._summary_cache
+      if cached is not None and all(new is old for new, old in zip(snapshots, cached[0])):
+         # Deep copy so callers cannot mutate the nested dicts held by the cache
+         return {'timestamp': datetime.now(), **copy.deepcopy(cached[1])}
+      
+      # Job statistics, counted in a single pass
+      running_state, queued_state, held_state = JobState.RUNNING, JobState.QUEUED, JobState.HELD
+      running = queued = held = other = 0
+      for job in jobs:
+         state = job.state
+         if state is running_state:
+            running += 1
+         elif state is queued_state:
+            queued += 1
+         elif state is held_state:
+            held += 1
+         else:
+            other += 1
+      
       job_stats = {
          'total': len(jobs),
-         'running': len([j for j in jobs if j.state == JobState.RUNNING]),
-         'queued': len([j for j in jobs if j.state == JobState.QUEUED]),
-         'held': len([j for j in jobs if j.state == JobState.HELD]),
-         'other': len([j for j in jobs if j.state not in [JobState.RUNNING, JobState.QUEUED, JobState.HELD]])
+         'running': running,
+         'queued': queued,
+         'held': held,
+         'other': other
       }
       
       # Queue depth statistics
@@ -426,24 +517,35 @@ class DataCollector:
       }
       
       # Queue statistics
+      enabled = sum(1 for q in queues if q.is_enabled())
       queue_stats = {
          'total': len(queues),
-         'enabled': len([q for q in queues if q.is_enabled()]),
-         'disabled': len(queues) - len([q for q in queues if q.is_enabled()])
+         'enabled': enabled,
+         'disabled': len(queues) - enabled
       }
       
-      # Node statistics
+      # Node and resource statistics, counted in a single pass
+      available = busy = offline = 0
+      total_cores = used_cores = 0
+      for node in nodes:
+         node_jobs = len(node.jobs)
+         is_available = node.is_available()
+         if is_available:
+            available += 1
+         if node_jobs:
+            busy += 1
+         elif not is_available:
+            offline += 1
+         total_cores += node.ncpus
+         used_cores += node_jobs
+      
       node_stats = {
          'total': len(nodes),
-         'available': len([n for n in nodes if n.is_available()]),
-         'busy': len([n for n in nodes if n.is_occupied()]),
-         'offline': len([n for n in nodes if not n.is_available() and not n.is_occupied()])
+         'available': available,
+         'busy': busy,
+         'offline': offline
       }
       
-      # Resource statistics
-      total_cores = sum(node.ncpus for node in nodes)
-      used_cores = sum(len(node.jobs) for node in nodes)
-      
       resource_stats = {
          'total_cores': total_cores,
          'used_cores': used_cores,
@@ -451,16 +553,18 @@ class DataCollector:
          'utilization': (used_cores / total_cores * 100) if total_cores > 0 else 0
       }
       
-      return {
-         'timestamp': datetime.now(),
+      stats = {
          'jobs': job_stats,
          'queues': queue_stats,
          'nodes': node_stats,
          'resources': resource_stats,
          'queue_depth': queue_depth
       }
+      self._summary_cache = (snapshots, stats)
+      
+      return {'timestamp': datetime.now(), **copy.deepcopy(stats)}
    
-   def get_user_jobs(self, user: str) -> List[PBSJob]:
+   def get_user_jobs(self, user: str) -> Sequence[PBSJob]:
       """
       Get jobs for specific user
       
@@ -498,12 +602,15 @@ class DataCollector:
       
       # Import here to avoid circular import
       from .database.models import JobHistory
+      from .database.repositories import JobStateInfo
       
       # Ensure cache is populated
       self._populate_job_state_cache_if_needed()
       
       history_entries = []
       cache_updates = {}
+      # Checked once, so the per-job debug message is only formatted when it is logged
+      log_changes = self.logger.isEnabledFor(logging.DEBUG)
       
       for job in current_jobs:
          cached_state = self._job_state_cache.get(job.job_id)
@@ -525,8 +632,9 @@ class DataCollector:
             cache_updates[job.job_id] = JobStateInfo.from_pbs_job(job)
             
             # Log the change for debugging
-            change_reason = "new job" if cached_state is None else "state/attribute change"
-            self.logger.debug(f"Creating history entry for job {job.job_id}: {change_reason}")
+            if log_changes:
+               change_reason = "new job" if cached_state is None else "state/attribute change"
+               self.logger.debug(f"Creating history entry for job {job.job_id}: {change_reason}")
       
       # Update cache with new states
       with self._update_lock:
@@ -572,6 +680,8 @@ class DataCollector:
       if not self._database_enabled:
          return []
       
+      from .database.repositories import ReservationStateInfo
+      
       # Populate cache if needed
       self._populate_reservation_state_cache_if_needed()
       
@@ -645,7 +755,9 @@ class DataCollector:
       if not self._database_enabled:
          raise RuntimeError("Database not available for persistence")
       
-      collection_start = datetime.now()
+      from .database import DataCollectionStatus
+      
+      collection_start = time.monotonic()
       
       # Log collection start
       self.logger.info(f"Starting {collection_type} data collection and persistence")
@@ -672,19 +784,21 @@ class DataCollector:
                self.logger.warning(f"Failed to collect completed jobs from PBS: {error_msg}")
          
          # Combine current jobs with completed jobs for database storage
-         all_jobs_for_db = self._jobs + completed_jobs
+         all_jobs_for_db = [*self._jobs, *completed_jobs]
          
          # Convert to database models - but use smart job history creation
          db_data = {
-            'jobs': [self._model_converters.job.to_database(job) for job in all_jobs_for_db],
-            'queues': [self._model_converters.queue.to_database(queue) for queue in self._queues],
-            'nodes': [self._model_converters.node.to_database(node) for node in self._nodes],
-            'reservations': [self._model_converters.reservation.to_database(reservation) for reservation in self._reservations],
+            'jobs': self._model_converters.job.to_database_batch(all_jobs_for_db),
+            'queues': self._model_converters.queue.to_database_batch(self._queues),
+            'nodes': self._model_converters.node.to_database_batch(self._nodes),
+            'reservations': self._model_converters.reservation.to_database_batch(self._reservations),
             'job_history': self._create_job_history_for_changes(all_jobs_for_db, log_id),
             'reservation_history': self._create_reservation_history_for_changes(self._reservations, log_id),
-            'queue_snapshots': [self._model_converters.queue.to_queue_snapshot(queue) for queue in self._queues],
-            'node_snapshots': [self._model_converters.node.to_node_snapshot(node) for node in self._nodes],
-            'system_snapshot': self._model_converters.system.to_system_snapshot(self._jobs, self._queues, self._nodes)
+            'queue_snapshots': [self._model_converters.queue.to_queue_snapshot(queue, log_id) for queue in self._queues],
+            'node_snapshots': [self._model_converters.node.to_node_snapshot(node, log_id) for node in self._nodes],
+            'system_snapshot': self._model_converters.system.to_system_snapshot(
+               self._jobs, self._queues, self._nodes, log_id
+            )
          }
          
          # Clean up cache for jobs and reservations that no longer exist
@@ -693,13 +807,6 @@ class DataCollector:
          self._cleanup_job_state_cache(current_job_ids)
          self._cleanup_reservation_state_cache(current_reservation_ids)
          
-         # Add collection log ID to remaining entries (job_history already has it)
-         for entry in db_data['queue_snapshots']:
-            entry.data_collection_id = log_id
-         for entry in db_data['node_snapshots']:
-            entry.data_collection_id = log_id
-         db_data['system_snapshot'].data_collection_id = log_id
-         
          # Persist to database
          job_repo = self._repository_factory.get_job_repository()
          queue_repo = self._repository_factory.get_queue_repository()
@@ -707,21 +814,24 @@ class DataCollector:
          reservation_repo = self._repository_factory.get_reservation_repository()
          system_repo = self._repository_factory.get_system_repository()
          
-         # Upsert current state
-         job_repo.upsert_jobs(db_data['jobs'])
-         queue_repo.upsert_queues(db_data['queues'])
-         node_repo.upsert_nodes(db_data['nodes'])
-         reservation_repo.upsert_reservations(db_data['reservations'])
-         
-         # Add historical snapshots
-         job_repo.add_job_history_batch(db_data['job_history'])
-         reservation_repo.add_reservation_history_batch(db_data['reservation_history'])
-         queue_repo.add_queue_snapshots(db_data['queue_snapshots'])
-         node_repo.add_node_snapshots(db_data['node_snapshots'])
-         system_repo.add_system_snapshot(db_data['system_snapshot'])
+         # All writes share one session, so the collection is committed (or
+         # rolled back) as a single transaction
+         with self._db_manager.get_session() as session:
+            # Upsert current state
+            job_repo.upsert_jobs(db_data['jobs'], session)
+            queue_repo.upsert_queues(db_data['queues'], session)
+            node_repo.upsert_nodes(db_data['nodes'], session)
+            reservation_repo.upsert_reservations(db_data['reservations'], session)
+            
+            # Add historical snapshots
+            job_repo.add_job_history_batch(db_data['job_history'], session)
+            reservation_repo.add_reservation_history_batch(db_data['reservation_history'], session)
+            queue_repo.add_queue_snapshots(db_data['queue_snapshots'], session)
+            node_repo.add_node_snapshots(db_data['node_snapshots'], session)
+            system_repo.add_system_snapshot(db_data['system_snapshot'], session)
          
          # Log completion
-         duration = (datetime.now() - collection_start).total_seconds()
+         duration = time.monotonic() - collection_start
          collection_repo.log_collection_complete(
             log_id, DataCollectionStatus.SUCCESS,
             jobs_collected=len(db_data['jobs']),
@@ -750,7 +860,7 @@ class DataCollector:
          
       except Exception as e:
          # Log failure
-         duration = (datetime.now() - collection_start).total_seconds()
+         duration = time.monotonic() - collection_start
          collection_repo.log_collection_complete(
             log_id, DataCollectionStatus.FAILED,
             duration=duration,
@@ -785,15 +895,13 @@ class DataCollector:
       
       # Get state transitions
       transitions = []
-      for i in range(1, len(history)):
-         prev_state = history[i-1].state
-         curr_state = history[i].state
-         if prev_state != curr_state:
+      for prev, curr in zip(history, history[1:]):
+         if prev.state != curr.state:
             transitions.append({
-               'from_state': prev_state.value,
-               'to_state': curr_state.value,
-               'timestamp': history[i].timestamp,
-               'duration_minutes': (history[i].timestamp - history[i-1].timestamp).total_seconds() / 60
+               'from_state': prev.state.value,
+               'to_state': curr.state.value,
+               'timestamp': curr.timestamp,
+               'duration_minutes': (curr.timestamp - prev.timestamp).total_seconds() / 60
             })
       
       return {
@@ -821,73 +929,86 @@ class DataCollector:
       job_repo = self._repository_factory.get_job_repository()
       return job_repo.get_user_job_statistics(user, days)
    
+   @_exclusive_refresh('jobs')
    def _refresh_jobs(self) -> None:
       """Refresh job data from PBS system"""
       try:
-         # Get cached server data and defaults BEFORE acquiring lock to avoid deadlock
+         # Get cached server data and defaults first; the server refresh has its own lock
          server_data = self.get_cached_server_data()
-         server_defaults = None
-         if server_data:
-            # Extract server defaults from server data
-            server_info = server_data.get("Server", {})
-            for server_name, server_details in server_info.items():
-               server_defaults = server_details.get("resources_default", {})
-               break
+         server_defaults = self._server_defaults
          self.logger.debug(f"Server defaults: {server_defaults}")
          
-         with self._update_lock:
-            self.logger.debug("Refreshing job data")
-            self._jobs = self.pbs_commands.qstat_jobs(
-               server_defaults=server_defaults, 
-               server_data=server_data
-            )
-            self._last_job_update = datetime.now()
-            self.logger.debug(f"Updated {len(self._jobs)} jobs")
+         self.logger.debug("Refreshing job data")
+         jobs = tuple(self.pbs_commands.qstat_jobs(
+            server_defaults=server_defaults, 
+            server_data=server_data
+         ))
+         # Index jobs by owner once per refresh so user queries are lookups
+         owner_jobs: Dict[str, List[PBSJob]] = {}
+         for job in jobs:
+            owner_jobs.setdefault(job.owner, []).append(job)
+         jobs_by_owner = {owner: tuple(user_jobs) for owner, user_jobs in owner_jobs.items()}
+         
+         self._jobs = jobs
+         self._jobs_by_owner = jobs_by_owner
+         self._last_job_update = time.monotonic()
+         self.logger.debug(f"Updated {len(jobs)} jobs")
       except PBSCommandError as e:
          self.logger.error(f"Failed to refresh jobs: {str(e)}")
    
+   @_exclusive_refresh('queues')
    def _refresh_queues(self) -> None:
       """Refresh queue data from PBS system"""
       try:
-         with self._update_lock:
-            self.logger.debug("Refreshing queue data")
-            self._queues = self.pbs_commands.qstat_queues()
-            self._last_queue_update = datetime.now()
-            self.logger.debug(f"Updated {len(self._queues)} queues")
+         self.logger.debug("Refreshing queue data")
+         queues = tuple(self.pbs_commands.qstat_queues())
+         self._queues = queues
+         self._last_queue_update = time.monotonic()
+         self.logger.debug(f"Updated {len(queues)} queues")
       except PBSCommandError as e:
          self.logger.error(f"Failed to refresh queues: {str(e)}")
    
+   @_exclusive_refresh('nodes')
    def _refresh_nodes(self) -> None:
       """Refresh node data from PBS system"""
       try:
-         with self._update_lock:
-            self.logger.debug("Refreshing node data")
-            self._nodes = self.pbs_commands.pbsnodes()
-            self._last_node_update = datetime.now()
-            self.logger.debug(f"Updated {len(self._nodes)} nodes")
+         self.logger.debug("Refreshing node data")
+         nodes = tuple(self.pbs_commands.pbsnodes())
+         self._nodes = nodes
+         self._last_node_update = time.monotonic()
+         self.logger.debug(f"Updated {len(nodes)} nodes")
       except PBSCommandError as e:
          self.logger.error(f"Failed to refresh nodes: {str(e)}")
    
+   @_exclusive_refresh('reservations')
    def _refresh_reservations(self) -> None:
       """Refresh reservation data from PBS system"""
       try:
-         with self._update_lock:
-            self.logger.debug("Refreshing reservation data")
-            self._reservations = self.pbs_commands.pbs_rstat_all_detailed()
-            self._last_reservation_update = datetime.now()
-            self.logger.debug(f"Updated {len(self._reservations)} reservations")
+         self.logger.debug("Refreshing reservation data")
+         reservations = tuple(self.pbs_commands.pbs_rstat_all_detailed())
+         self._reservations = reservations
+         self._last_reservation_update = time.monotonic()
+         self.logger.debug(f"Updated {len(reservations)} reservations")
       except PBSCommandError as e:
          self.logger.error(f"Failed to refresh reservations: {str(e)}")
    
+   @_exclusive_refresh('server')
    def _refresh_server(self) -> None:
       """Refresh server data from PBS system"""
       try:
-         with self._update_lock:
-            self.logger.debug("Refreshing server data 2")
-            self._server_data = self.pbs_commands.qstat_server()
-            self.logger.debug("Retrieved server data")
-            self._last_server_update = datetime.now()
-            self.logger.debug("Updated server data")
+         self.logger.debug("Refreshing server data 2")
+         server_data = self.pbs_commands.qstat_server()
+         self.logger.debug("Retrieved server data")
+         # Extract the first server's defaults once per refresh
+         server_defaults = None
+         if server_data:
+            for server_details in server_data.get("Server", {}).values():
+               server_defaults = server_details.get("resources_default", {})
+               break
+         self._server_defaults = server_defaults
+         self._server_data = server_data
+         self._last_server_update = time.monotonic()
+         self.logger.debug("Updated server data")
       except PBSCommandError as e:
          self.logger.error(f"Failed to refresh server data: {str(e)}")
    
@@ -899,8 +1020,7 @@ class DataCollector:
          Server defaults dictionary or None if not available
       """
       should_refresh = (
-         self._last_server_update is None or
-         (datetime.now() - self._last_server_update).total_seconds() > 
+         time.monotonic() - self._last_server_update > 
          self.config.pbs.server_refresh_interval
       )
       
@@ -908,13 +1028,7 @@ class DataCollector:
          self.logger.debug("Refreshing server data 1")
          self._refresh_server()
       
-      if self._server_data:
-         # Extract server defaults from server data
-         server_info = self._server_data.get("Server", {})
-         for server_name, server_details in server_info.items():
-            return server_details.get("resources_default", {})
-      
-      return None
+      return self._server_defaults
    
    def get_cached_server_data(self) -> Optional[Dict[str, Any]]:
       """
@@ -924,8 +1038,7 @@ class DataCollector:
          Full server data dictionary or None if not available
       """
       should_refresh = (
-         self._last_server_update is None or
-         (datetime.now() - self._last_server_update).total_seconds() > 
+         time.monotonic() - self._last_server_update > 
          self.config.pbs.server_refresh_interval
       )
       
@@ -936,11 +1049,17 @@ class DataCollector:
    
    def refresh_all(self) -> None:
       """Refresh all data from PBS system"""
+      # Job parsing uses the server defaults, so refresh those first
       self._refresh_server()
-      self._refresh_jobs()
-      self._refresh_queues()
-      self._refresh_nodes()
-      self._refresh_reservations()
+      
+      # The remaining PBS commands are independent subprocesses, so run them
+      # concurrently and wait for the slowest rather than their sum
+      refreshes = (self._refresh_jobs, self._refresh_queues,
+                   self._refresh_nodes, self._refresh_reservations)
+      with ThreadPoolExecutor(max_workers=len(refreshes),
+                              thread_name_prefix="pbs-refresh") as executor:
+         for future in [executor.submit(refresh) for refresh in refreshes]:
+            future.result()
    
    def start_background_updates(self) -> None:
       """Start background thread for automatic data updates"""
@@ -948,7 +1067,7 @@ class DataCollector:
          self.logger.warning("Background updates already running")
          return
       
-      self._stop_background_updates = False
+      self._stop_background_updates.clear()
       self._background_update_thread = threading.Thread(
          target=self._background_update_loop,
          daemon=True
@@ -961,61 +1080,65 @@ class DataCollector:
       if self._background_update_thread is None:
          return
       
-      self._stop_background_updates = True
+      self._stop_background_updates.set()
       self._background_update_thread.join(timeout=5)
       self._background_update_thread = None
       self.logger.info("Stopped background updates")
    
+   def _auto_persist(self) -> None:
+      """Persist collected data to the database from the background loop"""
+      try:
+         self.logger.debug("Triggering periodic database collection from daemon")
+         result = self.collect_and_persist(collection_type="daemon")
+         self._last_auto_persist = time.monotonic()
+         self.logger.debug(f"Periodic collection completed: {result['jobs_collected']} jobs, "
+                          f"{result['queues_collected']} queues, {result['nodes_collected']} nodes")
+      except Exception as e:
+         self.logger.error(f"Failed to persist data: {str(e)}")
+   
    def _background_update_loop(self) -> None:
-      """Background update loop"""
-      while not self._stop_background_updates:
+      """Background update loop, sleeping until the next refresh is due"""
+      pbs_config = self.config.pbs
+      
+      # (last successful update, interval, refresh) for each scheduled task.
+      # Jobs update most frequently, then nodes, then queues.
+      tasks = [
+         (lambda: self._last_job_update, pbs_config.job_refresh_interval, self._refresh_jobs),
+         (lambda: self._last_node_update, pbs_config.node_refresh_interval, self._refresh_nodes),
+         (lambda: self._last_queue_update, pbs_config.queue_refresh_interval, self._refresh_queues),
+      ]
+      
+      # Optionally persist data if database is enabled
+      if (self._database_enabled and 
+          hasattr(self.config, 'database') and 
+          self.config.database.auto_persist):
+         tasks.append((lambda: self._last_auto_persist,
+                       self.config.database.auto_persist_interval, self._auto_persist))
+      
+      # Deadlines also count from the last attempt, so a task whose PBS
+      # command keeps failing is retried once per interval, not continuously
+      last_attempt = [_NEVER] * len(tasks)
+      
+      while not self._stop_background_updates.is_set():
          try:
-            # Update jobs most frequently
-            if (self._last_job_update is None or 
-                (datetime.now() - self._last_job_update).total_seconds() > 
-                self.config.pbs.job_refresh_interval):
-               self._refresh_jobs()
-            
-            # Update nodes less frequently
-            if (self._last_node_update is None or 
-                (datetime.now() - self._last_node_update).total_seconds() > 
-                self.config.pbs.node_refresh_interval):
-               self._refresh_nodes()
-            
-            # Update queues least frequently
-            if (self._last_queue_update is None or 
-                (datetime.now() - self._last_queue_update).total_seconds() > 
-                self.config.pbs.queue_refresh_interval):
-               self._refresh_queues()
-            
-            # Optionally persist data if database is enabled and interval has elapsed
-            if (self._database_enabled and 
-                hasattr(self.config, 'database') and 
-                self.config.database.auto_persist):
-               
-               # Check if auto_persist interval has elapsed
-               should_persist = (
-                  self._last_auto_persist is None or
-                  (datetime.now() - self._last_auto_persist).total_seconds() > 
-                  self.config.database.auto_persist_interval
-               )
-               
-               if should_persist:
-                  try:
-                     self.logger.debug("Triggering periodic database collection from daemon")
-                     result = self.collect_and_persist(collection_type="daemon")
-                     self._last_auto_persist = datetime.now()
-                     self.logger.debug(f"Periodic collection completed: {result['jobs_collected']} jobs, "
-                                      f"{result['queues_collected']} queues, {result['nodes_collected']} nodes")
-                  except Exception as e:
-                     self.logger.error(f"Failed to persist data: {str(e)}")
+            next_due = float('inf')
+            for i, (last_update, interval, refresh) in enumerate(tasks):
+               due = max(last_update(), last_attempt[i]) + interval
+               now = time.monotonic()
+               if now >= due:
+                  last_attempt[i] = now
+                  refresh()
+                  due = max(last_update(), now) + interval
+               next_due = min(next_due, due)
             
-            # Sleep for a short interval
-            time.sleep(10)
+            # Sleep until the earliest deadline, waking early if stopped
+            self._stop_background_updates.wait(
+               max(_MIN_BACKGROUND_WAIT, next_due - time.monotonic())
+            )
             
          except Exception as e:
             self.logger.error(f"Error in background update loop: {str(e)}")
-            time.sleep(30)  # Wait longer on error
+            self._stop_background_updates.wait(30)  # Wait longer on error
    
    @property
    def database_enabled(self) -> bool:
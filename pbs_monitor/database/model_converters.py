@@ -5,7 +5,7 @@ Converts between in-memory PBS models (PBSJob, PBSQueue, PBSNode)
 and database models (Job, Queue, Node) for seamless data flow.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import datetime
 
 from ..models.job import PBSJob, JobState as PBSJobState
@@ -22,7 +22,7 @@ class JobConverter:
     """Converter between PBSJob and database Job models"""
     
     @staticmethod
-    def to_database(pbs_job: PBSJob) -> Job:
+    def to_database(pbs_job: PBSJob, last_updated: Optional[datetime] = None) -> Job:
         """Convert PBSJob to database Job model"""
         return Job(
             job_id=pbs_job.job_id,
@@ -57,10 +57,17 @@ class JobConverter:
             queue_time_seconds=pbs_job.queue_time_seconds,
             
             # Metadata
-            last_updated=datetime.now(),
+            last_updated=last_updated or datetime.now(),
             raw_pbs_data=pbs_job.raw_attributes
         )
     
+    @staticmethod
+    def to_database_batch(pbs_jobs: Iterable[PBSJob]) -> List[Job]:
+        """Convert PBSJobs to database Job models sharing one last_updated timestamp"""
+        now = datetime.now()
+        to_database = JobConverter.to_database
+        return [to_database(job, now) for job in pbs_jobs]
+    
     @staticmethod
     def from_database(db_job: Job) -> PBSJob:
         """Convert database Job to PBSJob model"""
@@ -121,7 +128,7 @@ class QueueConverter:
     """Converter between PBSQueue and database Queue models"""
     
     @staticmethod
-    def to_database(pbs_queue: PBSQueue) -> Queue:
+    def to_database(pbs_queue: PBSQueue, last_updated: Optional[datetime] = None) -> Queue:
         """Convert PBSQueue to database Queue model"""
         return Queue(
             name=pbs_queue.name,
@@ -140,10 +147,17 @@ class QueueConverter:
             priority=pbs_queue.priority,
             
             # Metadata
-            last_updated=datetime.now(),
+            last_updated=last_updated or datetime.now(),
             raw_pbs_data=pbs_queue.raw_attributes
         )
     
+    @staticmethod
+    def to_database_batch(pbs_queues: Iterable[PBSQueue]) -> List[Queue]:
+        """Convert PBSQueues to database Queue models sharing one last_updated timestamp"""
+        now = datetime.now()
+        to_database = QueueConverter.to_database
+        return [to_database(queue, now) for queue in pbs_queues]
+    
     @staticmethod
     def from_database(db_queue: Queue) -> PBSQueue:
         """Convert database Queue to PBSQueue model"""
@@ -198,7 +212,7 @@ class NodeConverter:
     """Converter between PBSNode and database Node models"""
     
     @staticmethod
-    def to_database(pbs_node: PBSNode) -> Node:
+    def to_database(pbs_node: PBSNode, last_updated: Optional[datetime] = None) -> Node:
         """Convert PBSNode to database Node model"""
         return Node(
             name=pbs_node.name,
@@ -211,10 +225,17 @@ class NodeConverter:
             properties=pbs_node.properties,
             
             # Metadata
-            last_updated=datetime.now(),
+            last_updated=last_updated or datetime.now(),
             raw_pbs_data=pbs_node.raw_attributes
         )
     
+    @staticmethod
+    def to_database_batch(pbs_nodes: Iterable[PBSNode]) -> List[Node]:
+        """Convert PBSNodes to database Node models sharing one last_updated timestamp"""
+        now = datetime.now()
+        to_database = NodeConverter.to_database
+        return [to_database(node, now) for node in pbs_nodes]
+    
     @staticmethod
     def from_database(db_node: Node) -> PBSNode:
         """Convert database Node to PBSNode model"""
@@ -250,7 +271,7 @@ class NodeConverter:
             jobs_list=pbs_node.jobs,
             load_average=pbs_node.loadavg,
             cpu_utilization_percent=pbs_node.cpu_utilization(),
-            memory_used_gb=pbs_node.memory_gb() if pbs_node.memory_gb() else None,
+            memory_used_gb=pbs_node.memory_gb() or None,
             data_collection_id=data_collection_id
         )
 
@@ -262,40 +283,48 @@ class SystemConverter:
     def to_system_snapshot(jobs: List[PBSJob], queues: List[PBSQueue], nodes: List[PBSNode],
                           data_collection_id: Optional[int] = None) -> SystemSnapshot:
         """Convert system state to SystemSnapshot"""
-        # Job statistics
+        now = datetime.now()
+        
+        # Job statistics and average run/queue times, counted in a single pass
         total_jobs = len(jobs)
-        running_jobs = len([j for j in jobs if j.state == PBSJobState.RUNNING])
-        queued_jobs = len([j for j in jobs if j.state == PBSJobState.QUEUED])
-        held_jobs = len([j for j in jobs if j.state == PBSJobState.HELD])
+        running_jobs = queued_jobs = held_jobs = 0
+        running_minutes = queued_minutes = 0.0
+        timed_running = timed_queued = 0
+        for job in jobs:
+            state = job.state
+            if state is PBSJobState.RUNNING:
+                running_jobs += 1
+                if job.start_time:
+                    running_minutes += (now - job.start_time).total_seconds() / 60
+                    timed_running += 1
+            elif state is PBSJobState.QUEUED:
+                queued_jobs += 1
+                if job.submit_time:
+                    queued_minutes += (now - job.submit_time).total_seconds() / 60
+                    timed_queued += 1
+            elif state is PBSJobState.HELD:
+                held_jobs += 1
         
-        # Resource statistics
+        # Resource statistics, counted in a single pass
         total_nodes = len(nodes)
-        available_nodes = len([n for n in nodes if n.is_available()])
-        total_cores = sum(node.ncpus for node in nodes)
-        used_cores = sum(len(node.jobs) for node in nodes)
+        available_nodes = total_cores = used_cores = 0
+        for node in nodes:
+            if node.is_available():
+                available_nodes += 1
+            total_cores += node.ncpus
+            used_cores += len(node.jobs)
         
         # Queue statistics
-        active_queues = len([q for q in queues if q.is_enabled()])
+        active_queues = sum(1 for q in queues if q.is_enabled())
         
         # Performance metrics
-        running_job_times = [
-            (datetime.now() - job.start_time).total_seconds() / 60
-            for job in jobs
-            if job.state == PBSJobState.RUNNING and job.start_time
-        ]
-        avg_runtime_minutes = sum(running_job_times) / len(running_job_times) if running_job_times else None
-        
-        queued_job_times = [
-            (datetime.now() - job.submit_time).total_seconds() / 60
-            for job in jobs
-            if job.state == PBSJobState.QUEUED and job.submit_time
-        ]
-        avg_queue_time_minutes = sum(queued_job_times) / len(queued_job_times) if queued_job_times else None
+        avg_runtime_minutes = running_minutes / timed_running if timed_running else None
+        avg_queue_time_minutes = queued_minutes / timed_queued if timed_queued else None
         
         system_utilization_percent = (used_cores / total_cores * 100) if total_cores > 0 else 0
         
         return SystemSnapshot(
-            timestamp=datetime.now(),
+            timestamp=now,
             total_jobs=total_jobs,
             running_jobs=running_jobs,
             queued_jobs=queued_jobs,
@@ -316,7 +345,7 @@ class ReservationConverter:
     """Converter between PBSReservation and database Reservation models"""
     
     @staticmethod
-    def to_database(pbs_reservation: PBSReservation) -> Reservation:
+    def to_database(pbs_reservation: PBSReservation, last_updated: Optional[datetime] = None) -> Reservation:
         """Convert PBSReservation to database Reservation model"""
         return Reservation(
             reservation_id=pbs_reservation.reservation_id,
@@ -349,9 +378,16 @@ class ReservationConverter:
             
             # Raw data
             raw_pbs_data=pbs_reservation.raw_attributes,
-            last_updated=datetime.now()
+            last_updated=last_updated or datetime.now()
         )
     
+    @staticmethod
+    def to_database_batch(pbs_reservations: Iterable[PBSReservation]) -> List[Reservation]:
+        """Convert PBSReservations to database Reservation models sharing one last_updated timestamp"""
+        now = datetime.now()
+        to_database = ReservationConverter.to_database
+        return [to_database(reservation, now) for reservation in pbs_reservations]
+    
     @staticmethod
     def from_database(db_reservation: Reservation) -> PBSReservation:
         """Convert database Reservation to PBSReservation model"""
@@ -413,16 +449,17 @@ class ModelConverters:
         self.system = SystemConverter()
     
     def convert_pbs_data_to_database(self, jobs: List[PBSJob], queues: List[PBSQueue], 
-                                   nodes: List[PBSNode]) -> Dict[str, Any]:
-        """Convert all PBS data to database models"""
+                                   nodes: List[PBSNode],
+                                   data_collection_id: Optional[int] = None) -> Dict[str, Any]:
+        """Convert all PBS data to database models, stamping snapshots with data_collection_id"""
         return {
-            'jobs': [self.job.to_database(job) for job in jobs],
-            'queues': [self.queue.to_database(queue) for queue in queues],
-            'nodes': [self.node.to_database(node) for node in nodes],
-            'job_history': [self.job.to_job_history(job) for job in jobs],
-            'queue_snapshots': [self.queue.to_queue_snapshot(queue) for queue in queues],
-            'node_snapshots': [self.node.to_node_snapshot(node) for node in nodes],
-            'system_snapshot': self.system.to_system_snapshot(jobs, queues, nodes)
+            'jobs': self.job.to_database_batch(jobs),
+            'queues': self.queue.to_database_batch(queues),
+            'nodes': self.node.to_database_batch(nodes),
+            'job_history': [self.job.to_job_history(job, data_collection_id) for job in jobs],
+            'queue_snapshots': [self.queue.to_queue_snapshot(queue, data_collection_id) for queue in queues],
+            'node_snapshots': [self.node.to_node_snapshot(node, data_collection_id) for node in nodes],
+            'system_snapshot': self.system.to_system_snapshot(jobs, queues, nodes, data_collection_id)
         }
     
     def convert_database_to_pbs_data(self, db_jobs: List[Job], db_queues: List[Queue], 
@@ -4,7 +4,8 @@ Database repositories for PBS Monitor
 Provides data access layer for database operations.
 """
 
-from typing import List, Optional, Dict, Any
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy import desc, func, and_, or_
 from sqlalchemy.orm import Session
@@ -23,13 +24,46 @@ from ..models.job import PBSJob
 class BaseRepository:
     """Base repository class with common functionality"""
     
-    def __init__(self, config: Optional[Config] = None):
+    # Keys per IN (...) query, kept under SQLite's default bound-parameter limit
+    IN_CLAUSE_CHUNK_SIZE = 900
+    # Rows flushed per batch when inserting history and snapshot entries
+    INSERT_CHUNK_SIZE = 1000
+    
+    def __init__(self, config: Optional[Config] = None,
+                 db_manager: Optional[DatabaseManager] = None):
         self.config = config or Config()
-        self._db_manager = DatabaseManager(self.config)
+        self._db_manager = db_manager or DatabaseManager(self.config)
     
     def get_session(self) -> Session:
         """Get database session"""
         return self._db_manager.get_session()
+    
+    @contextmanager
+    def _session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """Use the caller's session when given (the caller commits), otherwise open one"""
+        if session is not None:
+            yield session
+        else:
+            with self.get_session() as own_session:
+                yield own_session
+    
+    def _get_existing_by_key(self, session: Session, model: Any, key_column: Any,
+                             keys: List[Any]) -> Dict[Any, Any]:
+        """Load rows whose key is in keys with one IN query per chunk, keyed by that value"""
+        existing = {}
+        key_name = key_column.key
+        for start in range(0, len(keys), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = keys[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            for row in session.query(model).filter(key_column.in_(chunk)):
+                existing[getattr(row, key_name)] = row
+        return existing
+    
+    def _add_in_chunks(self, session: Session, rows: List[Any]) -> None:
+        """Insert rows in flushed chunks so the unit of work stays bounded"""
+        for start in range(0, len(rows), self.INSERT_CHUNK_SIZE):
+            session.add_all(rows[start:start + self.INSERT_CHUNK_SIZE])
+            session.flush()
+            session.expunge_all()
 
 
 class JobRepository(BaseRepository):
@@ -99,13 +133,16 @@ class JobRepository(BaseRepository):
             session.expunge_all()
             return jobs
     
-    def get_historical_jobs(self, user: Optional[str] = None, days: int = 30) -> List[Job]:
-        """Get historical jobs from database"""
+    def get_historical_jobs(self, user: Optional[str] = None, days: int = 30,
+                            completed_only: bool = False) -> List[Job]:
+        """Get historical jobs from database, optionally only completed ones"""
         cutoff_date = datetime.now() - timedelta(days=days)
         with self.get_session() as session:
             query = session.query(Job).filter(Job.last_updated >= cutoff_date)
             if user:
                 query = query.filter(Job.owner == user)
+            if completed_only:
+                query = query.filter(Job.state.in_([JobState.COMPLETED, JobState.FINISHED]))
             jobs = query.all()
             # Force loading of all attributes to avoid detached instance issues
             session.expunge_all()
@@ -118,20 +155,23 @@ class JobRepository(BaseRepository):
             session.commit()
             return job
     
-    def upsert_jobs(self, jobs: List[Job]) -> None:
+    def upsert_jobs(self, jobs: List[Job], session: Optional[Session] = None) -> None:
         """Insert or update jobs in database"""
-        with self.get_session() as session:
+        with self._session_scope(session) as session:
+            existing_jobs = self._get_existing_by_key(
+                session, Job, Job.job_id, [job.job_id for job in jobs]
+            )
             for job in jobs:
-                existing = session.query(Job).filter(Job.job_id == job.job_id).first()
+                existing = existing_jobs.get(job.job_id)
                 if existing:
                     # Update existing job
                     for attr, value in job.__dict__.items():
                         if not attr.startswith('_'):
                             setattr(existing, attr, value)
                 else:
-                    # Add new job
+                    # Add new job; later duplicates in the batch update it
                     session.add(job)
-            session.commit()
+                    existing_jobs[job.job_id] = job
     
     def update_job(self, job: Job) -> Job:
         """Update existing job"""
@@ -189,16 +229,13 @@ class JobRepository(BaseRepository):
                 **counts,
             }
     
-    def add_job_history_batch(self, job_histories: List[JobHistory]) -> None:
+    def add_job_history_batch(self, job_histories: List[JobHistory], session: Optional[Session] = None) -> None:
         """Add multiple job history entries"""
-        with self.get_session() as session:
-            session.add_all(job_histories)
-            session.commit()
+        with self._session_scope(session) as session:
+            self._add_in_chunks(session, job_histories)
     
     def get_latest_job_states(self) -> Dict[str, 'JobStateInfo']:
         """Get the latest state information for all jobs from job_history"""
-        from ..data_collector import JobStateInfo  # Import here to avoid circular import
-        
         with self.get_session() as session:
             # Get the latest job_history entry for each job_id
             # Use a window function to get the most recent entry per job
@@ -281,11 +318,27 @@ class JobRepository(BaseRepository):
 class JobStateInfo:
     """Information about a job's current state"""
     
+    __slots__ = ('fingerprint',)
+    
     def __init__(self, state: JobState, priority: int, execution_node: Optional[str], queue: str):
-        self.state = state
-        self.priority = priority
-        self.execution_node = execution_node
-        self.queue = queue
+        # Tracked attributes as one tuple, so has_changes is a single comparison
+        self.fingerprint = (state, priority, execution_node, queue)
+    
+    @property
+    def state(self) -> JobState:
+        return self.fingerprint[0]
+    
+    @property
+    def priority(self) -> int:
+        return self.fingerprint[1]
+    
+    @property
+    def execution_node(self) -> Optional[str]:
+        return self.fingerprint[2]
+    
+    @property
+    def queue(self) -> str:
+        return self.fingerprint[3]
     
     @classmethod
     def from_job(cls, job: Job) -> 'JobStateInfo':
@@ -309,12 +362,7 @@ class JobStateInfo:
     
     def has_changes(self, job: Job) -> bool:
         """Check if job has state changes"""
-        return (
-            self.state != job.state or
-            self.priority != job.priority or
-            self.execution_node != job.execution_node or
-            self.queue != job.queue
-        )
+        return self.fingerprint != (job.state, job.priority, job.execution_node, job.queue)
 
 
 class QueueRepository(BaseRepository):
@@ -367,20 +415,23 @@ class QueueRepository(BaseRepository):
             session.commit()
             return queue
     
-    def upsert_queues(self, queues: List[Queue]) -> None:
+    def upsert_queues(self, queues: List[Queue], session: Optional[Session] = None) -> None:
         """Insert or update queues in database"""
-        with self.get_session() as session:
+        with self._session_scope(session) as session:
+            existing_queues = self._get_existing_by_key(
+                session, Queue, Queue.name, [queue.name for queue in queues]
+            )
             for queue in queues:
-                existing = session.query(Queue).filter(Queue.name == queue.name).first()
+                existing = existing_queues.get(queue.name)
                 if existing:
                     # Update existing queue
                     for attr, value in queue.__dict__.items():
                         if not attr.startswith('_'):
                             setattr(existing, attr, value)
                 else:
-                    # Add new queue
+                    # Add new queue; later duplicates in the batch update it
                     session.add(queue)
-            session.commit()
+                    existing_queues[queue.name] = queue
     
     def update_queue(self, queue: Queue) -> Queue:
         """Update existing queue"""
@@ -423,11 +474,10 @@ class QueueRepository(BaseRepository):
             session.expunge(snap)
             return snap
     
-    def add_queue_snapshots(self, snapshots: List[QueueSnapshot]) -> None:
+    def add_queue_snapshots(self, snapshots: List[QueueSnapshot], session: Optional[Session] = None) -> None:
         """Add multiple queue snapshots"""
-        with self.get_session() as session:
-            session.add_all(snapshots)
-            session.commit()
+        with self._session_scope(session) as session:
+            self._add_in_chunks(session, snapshots)
     
     def get_queue_utilization_history(self, queue_name: str, days: int = 7) -> List[Dict[str, Any]]:
         """Get queue utilization history"""
@@ -507,20 +557,23 @@ class NodeRepository(BaseRepository):
             session.commit()
             return node
     
-    def upsert_nodes(self, nodes: List[Node]) -> None:
+    def upsert_nodes(self, nodes: List[Node], session: Optional[Session] = None) -> None:
         """Insert or update nodes in database"""
-        with self.get_session() as session:
+        with self._session_scope(session) as session:
+            existing_nodes = self._get_existing_by_key(
+                session, Node, Node.name, [node.name for node in nodes]
+            )
             for node in nodes:
-                existing = session.query(Node).filter(Node.name == node.name).first()
+                existing = existing_nodes.get(node.name)
                 if existing:
                     # Update existing node
                     for attr, value in node.__dict__.items():
                         if not attr.startswith('_'):
                             setattr(existing, attr, value)
                 else:
-                    # Add new node
+                    # Add new node; later duplicates in the batch update it
                     session.add(node)
-            session.commit()
+                    existing_nodes[node.name] = node
     
     def update_node(self, node: Node) -> Node:
         """Update existing node"""
@@ -563,11 +616,10 @@ class NodeRepository(BaseRepository):
             session.expunge(snap)
             return snap
     
-    def add_node_snapshots(self, snapshots: List[NodeSnapshot]) -> None:
+    def add_node_snapshots(self, snapshots: List[NodeSnapshot], session: Optional[Session] = None) -> None:
         """Add multiple node snapshots"""
-        with self.get_session() as session:
-            session.add_all(snapshots)
-            session.commit()
+        with self._session_scope(session) as session:
+            self._add_in_chunks(session, snapshots)
     
     def get_node_utilization_history(self, node_name: str, days: int = 7) -> List[Dict[str, Any]]:
         """Get node utilization history"""
@@ -610,11 +662,10 @@ class SystemRepository(BaseRepository):
             session.expunge_all()
             return snapshots
     
-    def add_system_snapshot(self, snapshot: SystemSnapshot) -> SystemSnapshot:
+    def add_system_snapshot(self, snapshot: SystemSnapshot, session: Optional[Session] = None) -> SystemSnapshot:
         """Add system snapshot to database"""
-        with self.get_session() as session:
+        with self._session_scope(session) as session:
             session.add(snapshot)
-            session.commit()
             return snapshot
     
     def get_system_utilization_history(self, days: int = 7) -> List[Dict[str, Any]]:
@@ -703,14 +754,16 @@ class ReservationRepository(BaseRepository):
             session.commit()
             return reservation
     
-    def upsert_reservations(self, reservations: List[Reservation]) -> None:
+    def upsert_reservations(self, reservations: List[Reservation], session: Optional[Session] = None) -> None:
         """Insert or update reservations in database"""
-        with self.get_session() as session:
+        with self._session_scope(session) as session:
+            existing_reservations = self._get_existing_by_key(
+                session, Reservation, Reservation.reservation_id,
+                [reservation.reservation_id for reservation in reservations]
+            )
             for reservation in reservations:
                 # Check if reservation exists
-                existing = session.query(Reservation).filter(
-                    Reservation.reservation_id == reservation.reservation_id
-                ).first()
+                existing = existing_reservations.get(reservation.reservation_id)
                 
                 if existing:
                     # Update existing reservation
@@ -719,10 +772,9 @@ class ReservationRepository(BaseRepository):
                             setattr(existing, key, value)
                     existing.last_updated = datetime.now()
                 else:
-                    # Add new reservation
+                    # Add new reservation; later duplicates in the batch update it
                     session.add(reservation)
-            
-            session.commit()
+                    existing_reservations[reservation.reservation_id] = reservation
     
     def update_reservation(self, reservation: Reservation) -> Reservation:
         """Update existing reservation"""
@@ -757,11 +809,10 @@ class ReservationRepository(BaseRepository):
             session.commit()
             return history
     
-    def add_reservation_history_batch(self, histories: List[ReservationHistory]) -> None:
+    def add_reservation_history_batch(self, histories: List[ReservationHistory], session: Optional[Session] = None) -> None:
         """Add multiple reservation history entries"""
-        with self.get_session() as session:
-            session.add_all(histories)
-            session.commit()
+        with self._session_scope(session) as session:
+            self._add_in_chunks(session, histories)
     
     def get_latest_reservation_states(self) -> Dict[str, 'ReservationStateInfo']:
         """Get latest state for each reservation"""
@@ -948,23 +999,26 @@ class DataCollectionRepository(BaseRepository):
 class RepositoryFactory:
     """Factory for creating repository instances"""
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None,
+                 db_manager: Optional[DatabaseManager] = None):
         self.config = config or Config()
+        # Repositories share one manager, and so one engine and connection pool
+        self._db_manager = db_manager or DatabaseManager(self.config)
     
     def get_job_repository(self) -> JobRepository:
-        return JobRepository(self.config)
+        return JobRepository(self.config, self._db_manager)
     
     def get_queue_repository(self) -> QueueRepository:
-        return QueueRepository(self.config)
+        return QueueRepository(self.config, self._db_manager)
     
     def get_node_repository(self) -> NodeRepository:
-        return NodeRepository(self.config)
+        return NodeRepository(self.config, self._db_manager)
     
     def get_system_repository(self) -> SystemRepository:
-        return SystemRepository(self.config)
+        return SystemRepository(self.config, self._db_manager)
     
     def get_reservation_repository(self) -> ReservationRepository:
-        return ReservationRepository(self.config)
+        return ReservationRepository(self.config, self._db_manager)
     
     def get_data_collection_repository(self) -> DataCollectionRepository:
-        return DataCollectionRepository(self.config) 
\ No newline at end of file
+        return DataCollectionRepository(self.config, self._db_manager) 
@@ -21,6 +21,11 @@ class JobState(Enum):
    FINISHED = "F"
 
 
+# State groups used by the predicates below, built once at import time
+_ACTIVE_STATES = frozenset({JobState.QUEUED, JobState.RUNNING, JobState.HELD})
+_DONE_STATES = frozenset({JobState.FINISHED, JobState.COMPLETED})
+
+
 @dataclass
 class PBSJob:
    """Represents a PBS job"""
@@ -198,7 +203,7 @@ class PBSJob:
    
    def is_active(self) -> bool:
       """Check if job is currently active (running or queued)"""
-      return self.state in [JobState.QUEUED, JobState.RUNNING, JobState.HELD]
+      return self.state in _ACTIVE_STATES
    
    def estimated_total_cores(self) -> int:
       """Calculate total cores requested"""
@@ -207,11 +212,11 @@ class PBSJob:
    def runtime_duration(self) -> Optional[str]:
       """Calculate runtime duration if job has started"""
       # Only show runtime for jobs that actually ran (have start time and finished)
-      if self.state not in [JobState.FINISHED, JobState.COMPLETED] and not self.start_time:
+      if self.state not in _DONE_STATES and not self.start_time:
          return None
       
       # For completed jobs, try to use actual walltime from resources_used first
-      if self.state in [JobState.FINISHED, JobState.COMPLETED] and self.raw_attributes:
+      if self.state in _DONE_STATES and self.raw_attributes:
          resources_used = self.raw_attributes.get('resources_used', {})
          actual_walltime = resources_used.get('walltime')
          if actual_walltime:
@@ -19,6 +19,10 @@ class NodeState(Enum):
    UNKNOWN = "unknown"
 
 
+# States in which a node can accept jobs, built once at import time
+_AVAILABLE_STATES = frozenset({NodeState.FREE, NodeState.JOB_SHARING})
+
+
 @dataclass
 class PBSNode:
    """Represents a PBS compute node"""
@@ -122,7 +126,7 @@ class PBSNode:
    
    def is_available(self) -> bool:
       """Check if node is available for jobs"""
-      return self.state in [NodeState.FREE, NodeState.JOB_SHARING]
+      return self.state in _AVAILABLE_STATES
    
    def is_occupied(self) -> bool:
       """Check if node is currently running jobs"""
@@ -16,6 +16,11 @@ class QueueState(Enum):
    DISABLED = "disabled"
 
 
+# State groups used by the predicates below, built once at import time
+_ENABLED_STATES = frozenset({QueueState.ENABLED, QueueState.ENABLED_STARTED, QueueState.ENABLED_STOPPED})
+_RUNNING_STATES = frozenset({QueueState.ENABLED, QueueState.ENABLED_STARTED})
+
+
 @dataclass
 class PBSQueue:
    """Represents a PBS queue"""
@@ -153,7 +158,7 @@ class PBSQueue:
    
    def is_enabled(self) -> bool:
       """Check if queue is enabled"""
-      return self.state in [QueueState.ENABLED, QueueState.ENABLED_STARTED, QueueState.ENABLED_STOPPED]
+      return self.state in _ENABLED_STATES
    
    def is_started(self) -> bool:
       """Check if queue is started"""
@@ -161,7 +166,7 @@ class PBSQueue:
    
    def status_description(self) -> str:
       """Get human-readable status description"""
-      if self.state in [QueueState.ENABLED, QueueState.ENABLED_STARTED]:
+      if self.state in _RUNNING_STATES:
          return "Enabled"
       elif self.state == QueueState.ENABLED_STOPPED:
          return "Enabled/Stopped"
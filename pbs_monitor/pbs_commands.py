@@ -729,6 +729,11 @@ class PBSCommands:
       Returns:
          True if PBS is available
       """
+      # Skip spawning a subprocess when qstat obviously isn't installed
+      if not os.access("/opt/pbs/bin/qstat", os.X_OK):
+         self.logger.debug("qstat not found at /opt/pbs/bin/qstat")
+         return False
+      
       try:
          # Try a simple qstat command
          self._run_command(["/opt/pbs/bin/qstat", "--version"])
@@ -0,0 +1,48 @@
+"""
+Array reductions for node summary statistics
+
+Per-node values are extracted once into flat NumPy arrays (structure of
+arrays) and reduced here with np.bincount. String fields (state, hardware
+type) must be mapped to small integer IDs by the caller.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def reduce_nodes(ncpus: np.ndarray, jobs_per: np.ndarray, mem_gb: np.ndarray,
+                 occupied: np.ndarray, state_ids: np.ndarray, hw_ids: np.ndarray,
+                 n_states: int, n_hw: int) -> Tuple:
+   """
+   Reduce per-node arrays into per-state and per-hardware-type totals
+
+   Args:
+      ncpus: CPUs per node (int64)
+      jobs_per: Number of jobs per node (int64)
+      mem_gb: Memory per node in GB, 0 when unknown (float64)
+      occupied: Whether each node is occupied (bool)
+      state_ids: State ID per node in range(n_states) (int64)
+      hw_ids: Hardware type ID per node in range(n_hw) (int64)
+      n_states: Number of distinct states
+      n_hw: Number of distinct hardware types
+
+   Returns:
+      Tuple of (state_counts, state_cpus, state_mem,
+      hw_counts, hw_cpus, hw_mem, hw_used, used_mem_gb)
+   """
+   state_counts = np.bincount(state_ids, minlength=n_states)
+   state_cpus = np.bincount(state_ids, weights=ncpus, minlength=n_states)
+   state_mem = np.bincount(state_ids, weights=mem_gb, minlength=n_states)
+
+   hw_counts = np.bincount(hw_ids, minlength=n_hw)
+   hw_cpus = np.bincount(hw_ids, weights=ncpus, minlength=n_hw)
+   hw_mem = np.bincount(hw_ids, weights=mem_gb, minlength=n_hw)
+   hw_used = np.bincount(hw_ids, weights=jobs_per, minlength=n_hw)
+
+   # Used memory is estimated proportionally to the job/CPU ratio on occupied nodes
+   mask = occupied & (ncpus > 0) & (mem_gb > 0)
+   used_mem = float(np.sum(mem_gb[mask] * jobs_per[mask] / ncpus[mask]))
+
+   return (state_counts, state_cpus, state_mem,
+           hw_counts, hw_cpus, hw_mem, hw_used, used_mem)
@@ -4,9 +4,17 @@ Formatting utilities for PBS Monitor
 
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
+from functools import lru_cache
 import re
 
 
+# The formatters below are pure functions of their arguments and see the same
+# small set of values over and over (job states, node sizes, walltimes), so
+# results are memoized per process. format_job_id is not cached since IDs are unique.
+_FORMAT_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_duration(seconds: Union[int, float, str, None]) -> str:
    """
    Format duration in seconds to human-readable string
@@ -90,6 +98,7 @@ def _format_walltime(walltime: str) -> str:
       return walltime
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_timestamp(
    timestamp: Optional[datetime],
    format_str: str = "%d-%m %H:%M"
@@ -113,6 +122,7 @@ def format_timestamp(
       return "N/A"
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_memory(memory: Optional[str]) -> str:
    """
    Format memory specification to human-readable string
@@ -169,6 +179,7 @@ def format_memory(memory: Optional[str]) -> str:
       return memory
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_percentage(value: Optional[float], decimal_places: int = 1) -> str:
    """
    Format percentage value
@@ -189,6 +200,7 @@ def format_percentage(value: Optional[float], decimal_places: int = 1) -> str:
       return "N/A"
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_number(value: Optional[Union[int, float]], 
                  decimal_places: int = 0) -> str:
    """
@@ -274,6 +286,7 @@ def format_node_list(nodes: list, max_display: int = 3) -> str:
    return f"{', '.join(displayed)} (+{remaining} more)"
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_state(state: str) -> str:
    """
    Format state for display with colors/symbols
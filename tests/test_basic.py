@@ -10,7 +10,7 @@ from pbs_monitor.models.job import PBSJob, JobState
 from pbs_monitor.models.queue import PBSQueue, QueueState
 from pbs_monitor.models.node import PBSNode, NodeState
 from pbs_monitor.config import Config
-from pbs_monitor.utils.formatters import format_duration, format_memory, format_timestamp
+from pbs_monitor.utils.formatters import format_duration, format_memory, format_timestamp, format_state
 
 
 class TestPBSJob:
@@ -187,6 +187,23 @@ class TestConfig:
       
       import logging
       assert config.get_log_level() == logging.DEBUG
+   
+   def test_config_ignores_unknown_keys(self):
+      """Test only known fields are loaded from file data"""
+      config = Config()
+      config._update_config_object(config.pbs, {'command_timeout': 60, 'unknown': 1})
+      
+      assert config.pbs.command_timeout == 60
+      assert not hasattr(config.pbs, 'unknown')
+   
+   def test_config_reparsed_when_file_changes(self, tmp_path):
+      """Test cached config data is not reused after the file changes"""
+      config_file = tmp_path / "config.yaml"
+      config_file.write_text("pbs:\n  command_timeout: 45\n")
+      assert Config(config_file=str(config_file)).pbs.command_timeout == 45
+      
+      config_file.write_text("pbs:\n  command_timeout: 120\n")
+      assert Config(config_file=str(config_file)).pbs.command_timeout == 120
 
 
 class TestFormatters:
@@ -212,6 +229,96 @@ class TestFormatters:
       dt = datetime(2023, 10, 30, 14, 30, 0)
       assert format_timestamp(dt) == "30-10 14:30"
       assert format_timestamp(None) == "N/A"
+   
+   def test_format_state_cached(self):
+      """Test state formatting is memoized"""
+      format_state.cache_clear()
+      assert format_state("R") == "Running"
+      assert format_state("job-exclusive") == "Job-Exclusive"
+      assert format_state("R") == "Running"
+      assert format_state.cache_info().hits == 1
+
+
+class TestNodeReduce:
+   """Test node summary array reductions"""
+   
+   def test_reduce_nodes_totals(self):
+      """Test per-state and per-hardware totals against hand-computed values"""
+      import numpy as np
+      from pbs_monitor.utils._node_reduce import reduce_nodes
+      
+      ncpus = np.array([16, 16, 8, 0], dtype=np.int64)
+      jobs_per = np.array([4, 0, 8, 0], dtype=np.int64)
+      mem_gb = np.array([32.0, 32.0, 0.0, 16.0])
+      occupied = np.array([True, False, True, False])
+      state_ids = np.array([0, 1, 0, 2], dtype=np.int64)
+      hw_ids = np.array([0, 0, 1, 1], dtype=np.int64)
+      
+      (state_counts, state_cpus, state_mem,
+       hw_counts, hw_cpus, hw_mem, hw_used, used_mem) = reduce_nodes(
+         ncpus, jobs_per, mem_gb, occupied, state_ids, hw_ids, 3, 2
+      )
+      
+      assert state_counts.tolist() == [2, 1, 1]
+      assert state_cpus.tolist() == [24, 16, 0]
+      assert state_mem.tolist() == [32.0, 32.0, 16.0]
+      assert hw_counts.tolist() == [2, 2]
+      assert hw_cpus.tolist() == [32, 8]
+      assert hw_mem.tolist() == [64.0, 16.0]
+      assert hw_used.tolist() == [4, 8]
+      # Only node 0 is occupied with known CPUs and memory: 32 GB * 4 / 16
+      assert used_mem == 8.0
+
+
+class TestDataCollector:
+   """Test DataCollector caching"""
+   
+   def test_concurrent_refresh_coalesced(self):
+      """Test concurrent stale reads share one PBS command"""
+      import threading
+      import time
+      from pbs_monitor.data_collector import DataCollector
+      
+      collector = DataCollector(Config(), enable_database=False)
+      node = PBSNode(name="node001", state=NodeState.FREE, ncpus=64)
+      
+      def slow_pbsnodes():
+         time.sleep(0.2)
+         return [node]
+      
+      collector.pbs_commands.pbsnodes = Mock(side_effect=slow_pbsnodes)
+      results = []
+      threads = [threading.Thread(target=lambda: results.append(collector.get_nodes()))
+                 for _ in range(4)]
+      for thread in threads:
+         thread.start()
+      for thread in threads:
+         thread.join()
+      
+      assert collector.pbs_commands.pbsnodes.call_count == 1
+      assert results == [(node,)] * 4
+   
+   def test_cached_summary_isolated(self):
+      """Test mutating a returned summary does not leak into the cached one"""
+      from pbs_monitor.data_collector import DataCollector
+      
+      collector = DataCollector(Config(), enable_database=False)
+      collector.pbs_commands.qstat_jobs = Mock(return_value=[])
+      collector.pbs_commands.qstat_queues = Mock(return_value=[])
+      collector.pbs_commands.pbsnodes = Mock(
+         return_value=[PBSNode(name="node001", state=NodeState.FREE, ncpus=64)])
+      
+      first = collector.get_system_summary()
+      first['nodes']['total'] = 999
+      first['resources'].clear()
+      second = collector.get_system_summary()
+      second['jobs']['total'] = 999
+      third = collector.get_system_summary()
+      
+      assert collector.pbs_commands.pbsnodes.call_count == 1
+      assert second['nodes']['total'] == 1
+      assert second['resources']['total_cores'] == 64
+      assert third['jobs']['total'] == 0
 
 
 class TestCLI:
@@ -225,7 +332,7 @@ class TestCLI:
       assert callable(main)
       assert StatusCommand is not None
    
-   @patch('pbs_monitor.cli.main.DataCollector')
+   @patch('pbs_monitor.data_collector.DataCollector')
    def test_cli_help(self, mock_collector):
       """Test CLI help output"""
       from pbs_monitor.cli.main import main
@@ -237,6 +344,42 @@ class TestCLI:
       result = main(['--help'])
       # Should exit with code 0 for help
       assert result == 0 or result is None  # argparse may not return exit code
+   
+   def test_create_parser_for_command(self):
+      """Test parser is built per command and reused"""
+      from pbs_monitor.cli.main import create_parser, _sniff_command
+      
+      assert _sniff_command(['-c', 'jobs', 'nodes', '-d']) == 'nodes'
+      assert _sniff_command(['--help', 'jobs']) is None
+      assert create_parser('jobs') is create_parser('jobs')
+      assert create_parser('bogus') is create_parser()
+      
+      args = create_parser('jobs').parse_args(['jobs', '-u', 'alice'])
+      assert args.command == 'jobs'
+      assert args.user == 'alice'
+   
+   def test_queues_piped_output(self, capsys):
+      """Test non-TTY output keeps the table title and aligned columns"""
+      import argparse
+      from pbs_monitor.cli.commands import QueuesCommand
+      
+      collector = Mock()
+      collector.get_queues.return_value = [
+         PBSQueue(name="small", state=QueueState.ENABLED, running_jobs=1),
+         PBSQueue(name="large", state=QueueState.ENABLED, running_jobs=12)
+      ]
+      args = argparse.Namespace(refresh=False, columns="name,running", collect=False)
+      
+      assert QueuesCommand(collector, Config()).execute(args) == 0
+      
+      lines = capsys.readouterr().out.splitlines()
+      assert lines[:2] == ["", "Queues (2 total)"]
+      assert lines[2].split() == ["Name", "Running"]
+      assert [line.split() for line in lines[3:]] == [["small", "1"], ["large", "12"]]
+      assert "\t" not in "".join(lines)
+      # Columns are aligned: the second column starts at the same offset on every line
+      column = lines[2].index("Running")
+      assert [line[column:].strip() for line in lines[3:]] == ["1", "12"]
 
 
 if __name__ == '__main__':